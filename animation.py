@@ -0,0 +1,118 @@
+"""
+Ordonnanceur d'animations central.
+
+Une seule boucle `after` cadencée à une fréquence cible fait avancer toutes
+les animations actives en fonction du temps écoulé (et non du nombre
+d'étapes) : sous charge, des frames sont sautées au lieu d'étirer
+l'animation.
+"""
+import time
+from instrumentation import timed
+
+
+TARGET_FPS = 30
+FRAME_TIME_WINDOW = 120  # Nombre de frames gardées pour les statistiques
+
+
+class Animation:
+    """Animation de durée fixe : update(progress) avec progress dans [0, 1]."""
+
+    def __init__(self, duration, update, on_done=None, owner=None):
+        self.duration = duration
+        self.update = update
+        self.on_done = on_done
+        self.owner = owner
+        self.start_time = None
+        self.cancelled = False
+
+
+class AnimationScheduler:
+    def __init__(self, widget, fps=TARGET_FPS):
+        self.widget = widget
+        self.frame_interval = 1.0 / fps
+        self.active = []
+        self.frames = 0
+        self.skipped_frames = 0
+        self.frame_times = []
+        self._after_id = None
+        self._last_tick = None
+
+    # ================== ENREGISTREMENT ==================
+    def start(self, duration, update, on_done=None, owner=None):
+        """Enregistre une animation ; la première frame est appliquée tout de suite."""
+        anim = Animation(duration, update, on_done, owner)
+        anim.start_time = time.perf_counter()
+        self.active.append(anim)
+        self._step(anim, anim.start_time)
+        self._ensure_running()
+        return anim
+
+    def cancel(self, anim):
+        anim.cancelled = True
+        if anim in self.active:
+            self.active.remove(anim)
+
+    def cancel_owner(self, owner):
+        """Annule toutes les animations d'un propriétaire (ex : carte recyclée)."""
+        for anim in [a for a in self.active if a.owner is owner]:
+            self.cancel(anim)
+
+    # ================== BOUCLE ==================
+    def _ensure_running(self):
+        if self._after_id is None and self.active:
+            self._last_tick = time.perf_counter()
+            self._after_id = self.widget.after(int(self.frame_interval * 1000), self._tick)
+
+    @timed("animation.step")
+    def _advance(self, anim, now):
+        progress = min((now - anim.start_time) / anim.duration, 1.0) if anim.duration > 0 else 1.0
+        anim.update(progress)
+        if progress >= 1.0 and not anim.cancelled:
+            self.cancel(anim)
+            if anim.on_done is not None:
+                anim.on_done()
+
+    def _step(self, anim, now):
+        """Avance une animation ; si elle échoue, seule celle-ci est annulée."""
+        try:
+            self._advance(anim, now)
+        except Exception as e:
+            print(f"❌ Animation interrompue : {e!r}")
+            self.cancel(anim)
+
+    @timed("animation.frame")
+    def _tick(self):
+        self._after_id = None
+        now = time.perf_counter()
+
+        # Frames manquées depuis la précédente (boucle Tk occupée)
+        late = now - self._last_tick - self.frame_interval
+        if late > self.frame_interval:
+            self.skipped_frames += int(late / self.frame_interval)
+        self._last_tick = now
+
+        for anim in list(self.active):
+            if not anim.cancelled:
+                self._step(anim, now)
+
+        elapsed = time.perf_counter() - now
+        self.frames += 1
+        self.frame_times.append(elapsed)
+        if len(self.frame_times) > FRAME_TIME_WINDOW:
+            del self.frame_times[0]
+
+        if self.active:
+            delay = max(self.frame_interval - elapsed, 0.001)
+            self._after_id = self.widget.after(int(delay * 1000), self._tick)
+
+    # ================== STATISTIQUES ==================
+    def stats(self):
+        """Animations actives, frames jouées/sautées et temps de frame (ms)."""
+        times = self.frame_times
+        return {
+            "active": len(self.active),
+            "frames": self.frames,
+            "skipped_frames": self.skipped_frames,
+            "frame_ms_avg": 1000 * sum(times) / len(times) if times else 0.0,
+            "frame_ms_max": 1000 * max(times) if times else 0.0,
+        }
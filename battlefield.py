@@ -0,0 +1,249 @@
+"""
+Champ de bataille virtualisé.
+
+Seules les cartes dont la cellule recoupe la zone visible du canvas sont
+matérialisées. Les cartes qui sortent de la vue (ou sont retirées du
+combat) retournent dans un pool et sont reliées à un autre ennemi au lieu
+d'être détruites puis recréées.
+
+Le nombre de colonnes suit la largeur du canvas. Redimensionnements, ajouts
+et retraits ne font que demander une mise en page : une seule passe est
+exécutée au repos de la boucle Tk, et seules les cartes dont la cellule a
+changé sont déplacées.
+"""
+from custom_card import CarteEnnemi, CARD_WIDTH, CARD_HEIGHT, enforce_image_budget
+from instrumentation import timed
+
+
+MIN_COLUMNS = 1      # Colonnes minimum, même dans une fenêtre très étroite
+CARD_PADDING = 10    # Marge autour de chaque carte
+OVERSCAN_ROWS = 1    # Lignes matérialisées en plus au-dessus/en dessous de la vue
+POOL_MAX = 12        # Cartes libres conservées pour recyclage
+
+# Position hors écran des cartes au repos dans le pool
+PARKED = (-10000, -10000)
+
+
+class Battlefield:
+    """Grille de cartes ennemies affichée dans un canvas défilant."""
+
+    def __init__(self, canvas, scheduler=None, columns=None, card_padding=CARD_PADDING,
+                 on_hp_change=None):
+        self.canvas = canvas
+        self.scheduler = scheduler
+        self.on_hp_change = on_hp_change  # Transmis aux cartes (historique)
+        # columns=None : nombre de colonnes calculé selon la largeur du canvas
+        self.fixed_columns = columns
+        self.columns = columns or MIN_COLUMNS
+        self.card_padding = card_padding
+
+        self.order = []      # IDs des ennemis, dans l'ordre d'affichage
+        self.visible = {}    # enemy_id -> (carte, window_id)
+        self.positions = {}  # enemy_id -> (x, y) de la carte matérialisée
+        self.pool = []       # (carte, window_id) libres
+
+        # Mise en page différée (une passe par rafale d'événements)
+        self._refresh_pending = None
+        self._scrollregion = None
+
+        # Sélection multiple (Ctrl+clic, ou clic simple en mode sélection)
+        self.selection = set()
+        self.select_mode = False
+
+        # Taille d'une cellule, mesurée sur la première carte matérialisée
+        self.cell_width = CARD_WIDTH + 2 * card_padding
+        self.cell_height = CARD_HEIGHT + 2 * card_padding
+        self._cell_measured = False
+
+        self.canvas.bind("<Configure>", lambda e: self.schedule_refresh())
+
+    # ================== DÉFILEMENT ==================
+    def yview(self, *args):
+        """Commande de la scrollbar : défile puis met à jour les cartes visibles."""
+        self.canvas.yview(*args)
+        self.refresh()
+
+    def on_mousewheel(self, event):
+        """Molette (Windows/macOS : event.delta, X11 : boutons 4/5)."""
+        direction = -1 if event.num == 4 or event.delta > 0 else 1
+        self.canvas.yview_scroll(direction, "units")
+        self.refresh()
+
+    # ================== CONTENU ==================
+    def add(self, enemy_id):
+        """Ajoute un ennemi en fin de grille."""
+        self.order.append(enemy_id)
+        self.schedule_refresh()
+
+    def add_many(self, enemy_ids):
+        """Ajoute un groupe d'ennemis avec une seule mise en page à la fin."""
+        self.order.extend(enemy_ids)
+        self.schedule_refresh()
+
+    def insert_many(self, enemy_ids, indices):
+        """
+        Remet des ennemis à leurs indices d'origine dans la grille (annulation
+        d'un retrait). Les indices sont ceux d'avant le retrait.
+        """
+        for index, enemy_id in sorted(zip(indices, enemy_ids)):
+            self.order.insert(min(index, len(self.order)), enemy_id)
+        self.schedule_refresh()
+
+    def remove(self, enemy_id):
+        """Retire un ennemi de la grille et recycle sa carte."""
+        self.remove_many([enemy_id])
+
+    def remove_many(self, enemy_ids):
+        """Retire plusieurs ennemis en un seul passage sur la grille."""
+        removed = set(enemy_ids) & set(self.order)
+        if not removed:
+            return
+        self.order = [enemy_id for enemy_id in self.order if enemy_id not in removed]
+        self.selection -= removed
+        for enemy_id in removed:
+            if enemy_id in self.visible:
+                self._release(enemy_id)
+        self.schedule_refresh()
+
+    def clear(self):
+        """Vide la grille (toutes les cartes retournent au pool)."""
+        for enemy_id in list(self.visible):
+            self._release(enemy_id)
+        self.order = []
+        self.selection.clear()
+        self.schedule_refresh()
+
+    def card(self, enemy_id):
+        """Carte actuellement matérialisée pour cet ennemi, ou None."""
+        entry = self.visible.get(enemy_id)
+        return entry[0] if entry else None
+
+    # ================== SÉLECTION ==================
+    def toggle_selection(self, enemy_id):
+        if enemy_id in self.selection:
+            self.selection.discard(enemy_id)
+        else:
+            self.selection.add(enemy_id)
+        carte = self.card(enemy_id)
+        if carte is not None:
+            carte.set_selected(enemy_id in self.selection)
+
+    def clear_selection(self):
+        for enemy_id in self.selection:
+            carte = self.card(enemy_id)
+            if carte is not None:
+                carte.set_selected(False)
+        self.selection.clear()
+
+    def selected_ids(self):
+        """IDs sélectionnés, dans l'ordre de la grille."""
+        return [enemy_id for enemy_id in self.order if enemy_id in self.selection]
+
+    def _on_card_click(self, carte, force=False):
+        """Clic sur le canvas d'une carte : bascule la sélection si demandé."""
+        if (force or self.select_mode) and carte.enemy is not None:
+            self.toggle_selection(carte.enemy["id"])
+
+    # ================== GÉOMÉTRIE ==================
+    def compute_columns(self):
+        """Colonnes qui tiennent dans la largeur actuelle du canvas."""
+        if self.fixed_columns:
+            return self.fixed_columns
+        width = self.canvas.winfo_width()
+        if width <= 1:
+            return self.columns  # Canvas pas encore affiché
+        return max(MIN_COLUMNS, width // self.cell_width)
+
+    def cell_position(self, index):
+        row, col = divmod(index, self.columns)
+        return (col * self.cell_width + self.card_padding,
+                row * self.cell_height + self.card_padding)
+
+    def visible_range(self):
+        """Indices (début, fin exclue) des cellules recoupant la vue."""
+        top = self.canvas.canvasy(0)
+        bottom = self.canvas.canvasy(max(self.canvas.winfo_height(), 1))
+        first_row = max(int(top // self.cell_height) - OVERSCAN_ROWS, 0)
+        last_row = int(bottom // self.cell_height) + OVERSCAN_ROWS
+        return first_row * self.columns, min((last_row + 1) * self.columns, len(self.order))
+
+    def _update_scrollregion(self):
+        rows = -(-len(self.order) // self.columns)
+        region = (0, 0, self.columns * self.cell_width, rows * self.cell_height)
+        if region != self._scrollregion:
+            self._scrollregion = region
+            self.canvas.configure(scrollregion=region)
+
+    # ================== MATÉRIALISATION ==================
+    def schedule_refresh(self):
+        """Demande une mise en page ; les demandes d'une même rafale sont fusionnées."""
+        if self._refresh_pending is None:
+            self._refresh_pending = self.canvas.after_idle(self.refresh)
+
+    @timed("battlefield.refresh")
+    def refresh(self):
+        """
+        Matérialise les cartes visibles et recycle les autres. Seules les
+        cartes dont la cellule a changé (reflow, retrait) sont déplacées.
+        """
+        if self._refresh_pending is not None:
+            self.canvas.after_cancel(self._refresh_pending)
+            self._refresh_pending = None
+
+        self.columns = self.compute_columns()
+        self._update_scrollregion()
+        start, end = self.visible_range()
+        wanted = {self.order[i]: i for i in range(start, end)}
+
+        for enemy_id in list(self.visible):
+            if enemy_id not in wanted:
+                self._release(enemy_id)
+
+        for enemy_id, index in wanted.items():
+            position = self.cell_position(index)
+            if enemy_id in self.visible:
+                if self.positions[enemy_id] != position:
+                    _, window_id = self.visible[enemy_id]
+                    self.canvas.coords(window_id, *position)
+            else:
+                self._materialize(enemy_id, *position)
+            self.positions[enemy_id] = position
+
+        # Les types encore à l'écran ne sont jamais évincés
+        enforce_image_budget(carte.enemy for carte, _ in self.visible.values())
+
+    def _materialize(self, enemy_id, x, y):
+        if self.pool:
+            carte, window_id = self.pool.pop()
+            carte.bind_enemy(enemy_id)
+            self.canvas.coords(window_id, x, y)
+        else:
+            carte = CarteEnnemi(self.canvas, enemy_id, scheduler=self.scheduler,
+                                on_hp_change=self.on_hp_change)
+            carte.canvas.bind("<Button-1>", lambda e, c=carte: self._on_card_click(c))
+            carte.canvas.bind("<Control-Button-1>", lambda e, c=carte: self._on_card_click(c, True))
+            window_id = self.canvas.create_window(x, y, window=carte, anchor="nw")
+            if not self._cell_measured:
+                self._measure_cell(carte)
+        carte.set_selected(enemy_id in self.selection)
+        self.visible[enemy_id] = (carte, window_id)
+
+    def _measure_cell(self, carte):
+        carte.update_idletasks()
+        self.cell_width = carte.winfo_reqwidth() + 2 * self.card_padding
+        self.cell_height = carte.winfo_reqheight() + 2 * self.card_padding
+        self._cell_measured = True
+        # Les positions calculées avant la mesure sont à refaire
+        self.schedule_refresh()
+
+    def _release(self, enemy_id):
+        carte, window_id = self.visible.pop(enemy_id)
+        self.positions.pop(enemy_id, None)
+        if len(self.pool) < POOL_MAX:
+            # Carte au repos : plus aucune image retenue jusqu'à sa réutilisation
+            carte.park()
+            self.canvas.coords(window_id, *PARKED)
+            self.pool.append((carte, window_id))
+        else:
+            self.canvas.delete(window_id)
+            carte.destroy()
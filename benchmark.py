@@ -0,0 +1,329 @@
+"""
+Banc de mesure des chemins critiques : construction des cartes, modify_hp,
+frames du fondu, draw_death, get_enemy_data et fin de session.
+
+Chaque mesure est répétée pour plusieurs tailles de champ de bataille
+(1, 10, 50, 200 cartes) et de catalogue. Les résultats (percentiles en ms,
+pic mémoire) sont écrits en JSON et peuvent être comparés à une référence :
+
+    python benchmark.py --save bench_reference.json
+    python benchmark.py --compare bench_reference.json
+
+Sans affichage disponible (ou avec --headless), les cartes passent par le
+rendu PIL de headless_render au lieu du canvas Tk. Sous Linux, un affichage
+virtuel convient : xvfb-run python benchmark.py
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+try:
+    import resource  # Unix uniquement
+except ImportError:
+    resource = None
+
+
+CARD_COUNTS = (1, 10, 50, 200)
+CATALOGUE_SIZES = (10, 100, 500)
+HP_CLICKS_PER_CARD = 5
+LOOKUPS = 2000
+REGRESSION_THRESHOLD = 0.20  # +20 % sur p50 ou p90
+
+
+# ================== ISOLATION ==================
+def isolate_database(workdir):
+    """Travaille sur une copie du catalogue et une session jetable."""
+    import db_manager
+    db_path = os.path.join(workdir, "ennemy_mod.db")
+    db_manager.checkpoint()
+    shutil.copyfile(db_manager.DB_PATH, db_path)
+    db_manager.DB_PATH = db_path
+    db_manager.SESSION_DB_PATH = os.path.join(workdir, "combat_session.db")
+
+
+def grow_catalogue(size):
+    """Complète le catalogue avec des ennemis synthétiques jusqu'à `size` lignes."""
+    from database import connect_db
+    from catalogue import CATALOGUE
+    conn = connect_db()
+    current = conn.execute("SELECT COUNT(*) FROM ennemis").fetchone()[0]
+    images = [row[0] for row in conn.execute("SELECT DISTINCT image FROM ennemis")]
+    with conn:
+        conn.executemany(
+            "INSERT INTO ennemis (nom, mouvement, attaque, pv, pv_max, elite, boss, image) "
+            "VALUES (?, 2, 3, 6, 6, ?, 0, ?)",
+            [(f"Monstre {i:04d}", i % 2, images[i % len(images)]) for i in range(current, size)]
+        )
+    CATALOGUE.load(force=True)
+
+
+def spawn_rows(count):
+    """Ajoute `count` ennemis du catalogue à une session vide ; retourne leurs IDs."""
+    from db_manager import reset_session
+    from combat_state import COMBAT_STORE
+    from catalogue import CATALOGUE
+    reset_session()
+    COMBAT_STORE.clear()
+    noms = CATALOGUE.names()
+    rows = []
+    for i in range(count):
+        enemy = CATALOGUE.get(noms[i % len(noms)])
+        rows.append({"ennemi_source_id": enemy["id"], "nom": enemy["nom"],
+                     "mouvement": enemy["mouvement"], "attaque": enemy["attaque"],
+                     "pv": enemy["pv"], "pv_max": enemy["pv_max"],
+                     "elite": enemy["elite"], "image": enemy["image"]})
+    ids = COMBAT_STORE.add_many(rows)
+    COMBAT_STORE.flush()
+    return ids
+
+
+# ================== MESURE ==================
+def max_rss_kb():
+    """Pic de mémoire résidente du processus en Kio, ou None (Windows)."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux : Kio ; macOS : octets
+    return rss / 1024 if sys.platform == "darwin" else rss
+
+
+class Recorder:
+    def __init__(self):
+        self.results = {}
+
+    def measure(self, name, func, items, setup=None):
+        """
+        Chronomètre func(item) pour chaque item ; enregistre percentiles et pic
+        mémoire. `setup(item)`, s'il est fourni, s'exécute hors chronomètre.
+        """
+        tracemalloc.start()
+        samples = []
+        for item in items:
+            if setup is not None:
+                setup(item)
+            start = time.perf_counter()
+            func(item)
+            samples.append((time.perf_counter() - start) * 1000)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.results[name] = summarize(samples, peak)
+        r = self.results[name]
+        print(f"  {name:<40} n={r['n']:<5} p50={r['p50_ms']:8.3f} ms  "
+              f"p90={r['p90_ms']:8.3f} ms  p99={r['p99_ms']:8.3f} ms  "
+              f"pic={r['peak_kb']:9.1f} Ko")
+
+
+def summarize(samples, peak_bytes):
+    if len(samples) > 1:
+        cuts = statistics.quantiles(samples, n=100, method="inclusive")
+        p50, p90, p99 = cuts[49], cuts[89], cuts[98]
+    else:
+        p50 = p90 = p99 = samples[0]
+    return {
+        "n": len(samples),
+        "mean_ms": statistics.fmean(samples),
+        "p50_ms": p50,
+        "p90_ms": p90,
+        "p99_ms": p99,
+        "max_ms": max(samples),
+        "peak_kb": peak_bytes / 1024,
+    }
+
+
+# ================== SCÉNARIOS ==================
+def bench_database(rec):
+    from database import get_enemy_data
+    from catalogue import CATALOGUE
+    for size in CATALOGUE_SIZES:
+        grow_catalogue(size)
+        noms = CATALOGUE.names()
+        keys = [random.choice(noms) if i % 2 else CATALOGUE.get(random.choice(noms))["id"]
+                for i in range(LOOKUPS)]
+        rec.measure(f"get_enemy_data[catalogue={size}]", get_enemy_data, keys)
+
+
+def bench_end_session(rec):
+    """Même séquence que clear_table() à la fermeture de JeuGUI."""
+    from db_manager import end_session
+    from combat_state import COMBAT_STORE
+
+    def end(_):
+        COMBAT_STORE.clear()
+        end_session()
+
+    for count in CARD_COUNTS:
+        rec.measure(f"clear_table[cartes={count}]", end, range(5),
+                    setup=lambda _: spawn_rows(count))
+
+
+def bench_tk(rec, root):
+    import tkinter as tk
+    from animation import AnimationScheduler
+    from custom_card import CarteEnnemi, FADE_STEPS, STATIC_LAYERS
+
+    scheduler = AnimationScheduler(root)
+    for count in CARD_COUNTS:
+        ids = spawn_rows(count)
+        frame = tk.Frame(root)
+        frame.pack()
+        cards = []
+
+        def build(enemy_id):
+            card = CarteEnnemi(frame, enemy_id, scheduler=scheduler)
+            while not card.ready:
+                root.update()
+            card.grid(row=len(cards) // 10, column=len(cards) % 10)
+            root.update_idletasks()
+            cards.append(card)
+
+        rec.measure(f"CarteEnnemi.__init__[cartes={count}]", build, ids)
+
+        def click(card):
+            card.modify_hp(-1)
+            root.update_idletasks()
+
+        rec.measure(f"modify_hp[cartes={count}]", click, cards * HP_CLICKS_PER_CARD)
+
+        def fade(card):
+            # Construction des frames comprise (attendue ici, jamais par l'appli)
+            STATIC_LAYERS.want_fade(card.enemy, card)
+            STATIC_LAYERS.fade_frames(card.enemy)
+            for step in range(FADE_STEPS + 1):
+                card.set_fade_step(step)
+            root.update_idletasks()
+
+        rec.measure(f"fade_to_gray_frames[cartes={count}]", fade, cards)
+
+        def death(card):
+            card.draw_death()
+            root.update_idletasks()
+
+        rec.measure(f"draw_death[cartes={count}]", death, cards)
+        for card in cards:
+            card.cancel_animations()
+        frame.destroy()
+
+
+def bench_headless(rec):
+    import headless_render as hr
+    from combat_state import COMBAT_STORE
+    from custom_card import STATIC_LAYERS
+
+    for count in CARD_COUNTS:
+        ids = spawn_rows(count)
+        images = {}
+
+        def build(enemy_id):
+            images[enemy_id] = hr.render_card(COMBAT_STORE.get(enemy_id))
+
+        rec.measure(f"render_card[cartes={count}]", build, ids)
+
+        def click(enemy_id):
+            enemy = COMBAT_STORE.get(enemy_id)
+            COMBAT_STORE.set_pv(enemy_id, max(enemy["pv"] - 1, 0))
+            hr.draw_hp_bar(images[enemy_id], enemy)
+
+        rec.measure(f"modify_hp[cartes={count}]", click, ids * HP_CLICKS_PER_CARD)
+
+        # Même chemin que les cartes Tk : frames de couche composées par type
+        def fade(enemy_id):
+            for frame in STATIC_LAYERS.fade_frames(COMBAT_STORE.get(enemy_id)):
+                images[enemy_id].alpha_composite(frame, (0, 0))
+
+        rec.measure(f"fade_to_gray_frames[cartes={count}]", fade, ids)
+        rec.measure(f"draw_death[cartes={count}]", lambda i: hr.draw_death(images[i]), ids)
+
+
+# ================== COMPARAISON ==================
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """Liste des régressions (p50 ou p90 au-delà du seuil) par rapport à la référence."""
+    regressions = []
+    for name, ref in baseline["results"].items():
+        cur = results.get(name)
+        if cur is None:
+            continue
+        for key in ("p50_ms", "p90_ms"):
+            if ref[key] > 0 and cur[key] > ref[key] * (1 + threshold):
+                regressions.append((name, key, ref[key], cur[key]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mesure des chemins critiques des cartes et de la base.")
+    parser.add_argument("--headless", action="store_true", help="force le rendu PIL, sans Tk")
+    parser.add_argument("--save", metavar="JSON", help="écrit les résultats dans ce fichier")
+    parser.add_argument("--compare", metavar="JSON", help="compare à une référence sauvegardée")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="hausse tolérée avant de signaler une régression (0.2 = +20 %%)")
+    args = parser.parse_args(argv)
+
+    random.seed(0)
+    workdir = tempfile.mkdtemp(prefix="gloomhaven_bench_")
+    isolate_database(workdir)
+
+    root = None
+    if not args.headless:
+        import tkinter as tk
+        try:
+            root = tk.Tk()
+        except tk.TclError:
+            print("⚠️ Aucun affichage : passage au rendu headless.")
+
+    rec = Recorder()
+    try:
+        print("▶ Base de données")
+        bench_database(rec)
+        bench_end_session(rec)
+        print("▶ Cartes (" + ("Tk" if root else "headless") + ")")
+        if root is not None:
+            bench_tk(rec, root)
+        else:
+            bench_headless(rec)
+    finally:
+        if root is not None:
+            root.destroy()
+        from combat_state import COMBAT_STORE
+        from db_manager import close_all
+        COMBAT_STORE.clear()
+        close_all()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "mode": "tk" if root is not None else "headless",
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "max_rss_kb": max_rss_kb(),  # None : indisponible sur cette plateforme
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": rec.results,
+    }
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Résultats écrits dans {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(rec.results, baseline, args.threshold)
+        for name, key, ref, cur in regressions:
+            print(f"❌ Régression {name} {key} : {ref:.3f} ms -> {cur:.3f} ms")
+        if regressions:
+            return 1
+        print("✅ Aucune régression par rapport à la référence.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
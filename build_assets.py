@@ -0,0 +1,111 @@
+"""
+Pré-rendu des assets des cartes à leur résolution d'affichage.
+
+Chaque image référencée par le catalogue (fonds papyrus, portraits, icônes,
+boutons, brosses de la croix rouge) est redimensionnée une fois pour toutes
+aux tailles dérivées de SCALE_FACTOR, avec une variante grise pour les
+images du fondu. Les fichiers vont dans BAKED_ASSETS_DIR ; la clé contient
+la date de modification de la source et la taille cible. À l'exécution,
+AssetCache lit ces variantes et ne redimensionne que si l'une manque.
+
+    python build_assets.py            # ne refait que les variantes absentes
+    python build_assets.py --force    # refait tout
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from custom_card import (
+    BAKED_ASSETS_DIR, RESSOURCES_DIR, BG_SIZE, ENEMY_SIZE,
+    background_path, portrait_path, card_asset_specs, baked_asset_path, render_asset,
+)
+
+
+def death_brush_sizes():
+    """(chemin, taille) des deux brosses de la croix rouge, agrandies x1.5 comme à l'écran."""
+    from database import get_ressource_ui
+    sizes = []
+    for nom in ("red_line_right", "red_line_left"):
+        data = get_ressource_ui(nom)
+        if not data:
+            print(f"⚠️ Ressource '{nom}' introuvable : brosse non pré-rendue.")
+            continue
+        path = os.path.join(RESSOURCES_DIR, data["image"])
+        width, height = render_asset(path).size
+        sizes.append((path, (int(width * 1.5), int(height * 1.5))))
+    return sizes
+
+
+def collect_variants(enemies):
+    """Ensemble des (chemin, taille, variante) à pré-rendre pour ces ennemis."""
+    variants = set()
+    for enemy in enemies:
+        for path, size, _ in card_asset_specs(enemy):
+            variants.add((path, tuple(size), "couleur"))
+        # Images du fondu vers le gris
+        variants.add((background_path(enemy), BG_SIZE, "gris"))
+        variants.add((portrait_path(enemy), ENEMY_SIZE, "gris"))
+    for path, size in death_brush_sizes():
+        variants.add((path, size, "couleur"))
+    return variants
+
+
+def bake(path, size, variant, force=False):
+    """Écrit une variante pré-rendue. Retourne True si le fichier a été (re)généré."""
+    target = baked_asset_path(path, size, variant)
+    if target is None:
+        print(f"❌ Source introuvable : {path}")
+        return False
+    if not force and os.path.exists(target):
+        return False
+
+    img = render_asset(path, size)
+    if variant == "gris":
+        img = img.convert("RGBA").convert("L")
+
+    # Écriture atomique : l'application peut lire le dossier en même temps
+    tmp_path = f"{target}.{os.getpid()}.tmp"
+    img.save(tmp_path, format="PNG")
+    os.replace(tmp_path, target)
+    return True
+
+
+def prune(keep):
+    """Supprime les variantes périmées (source modifiée, taille abandonnée)."""
+    removed = 0
+    for name in os.listdir(BAKED_ASSETS_DIR):
+        path = os.path.join(BAKED_ASSETS_DIR, name)
+        if path not in keep:
+            os.remove(path)
+            removed += 1
+    return removed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pré-rendu des assets des cartes.")
+    parser.add_argument("--force", action="store_true", help="régénère toutes les variantes")
+    parser.add_argument("--workers", type=int, default=None, help="nombre de threads")
+    args = parser.parse_args(argv)
+
+    from catalogue import CATALOGUE
+    CATALOGUE.load()
+    enemies = [CATALOGUE.by_name[nom] for nom in CATALOGUE.names()]
+    variants = []
+    for variant in sorted(collect_variants(enemies)):
+        if os.path.exists(variant[0]):
+            variants.append(variant)
+        else:
+            print(f"❌ Source introuvable : {variant[0]}")
+
+    os.makedirs(BAKED_ASSETS_DIR, exist_ok=True)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers or os.cpu_count() or 1) as pool:
+        baked = sum(pool.map(lambda v: bake(*v, force=args.force), variants))
+
+    removed = prune({baked_asset_path(*v) for v in variants})
+    print(f"✅ {baked} variante(s) générée(s), {len(variants) - baked} déjà à jour, "
+          f"{removed} périmée(s) supprimée(s) en {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
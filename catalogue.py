@@ -0,0 +1,97 @@
+"""
+Index en mémoire du catalogue des ennemis (table `ennemis`).
+
+Chargé une seule fois, il répond aux recherches par id, par nom exact et
+par préfixe / sous-chaîne normalisés (casse et accents ignorés) sans
+aller-retour vers la base.
+"""
+import bisect
+import threading
+import unicodedata
+from db_manager import get_connection
+
+
+CATALOGUE_COLUMNS = ("id", "nom", "elite", "boss", "mouvement", "attaque", "pv", "pv_max", "image")
+
+
+def normaliser(texte):
+    """Minuscules, sans accents ni espaces superflus."""
+    decompose = unicodedata.normalize("NFKD", texte)
+    sans_accents = "".join(c for c in decompose if not unicodedata.combining(c))
+    return " ".join(sans_accents.casefold().split())
+
+
+class EnemyCatalog:
+    def __init__(self):
+        self.by_id = {}
+        self.by_name = {}
+        self._sorted_keys = []   # (nom normalisé, nom) triés, pour le préfixe
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def load(self, force=False):
+        """Charge tout le catalogue en une requête (une seule fois par défaut)."""
+        with self._lock:
+            if self._loaded and not force:
+                return
+            conn = get_connection()
+            cursor = conn.cursor()
+            try:
+                cursor.execute(f"SELECT {', '.join(CATALOGUE_COLUMNS)} FROM ennemis")
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+
+            self.by_id.clear()
+            self.by_name.clear()
+            for row in rows:
+                enemy = dict(zip(CATALOGUE_COLUMNS, row))
+                enemy["elite"] = bool(enemy["elite"])
+                enemy["boss"] = bool(enemy["boss"])
+                self.by_id[enemy["id"]] = enemy
+                self.by_name[enemy["nom"]] = enemy
+            self._sorted_keys = sorted((normaliser(nom), nom) for nom in self.by_name)
+            self._loaded = True
+
+    # ================== RECHERCHE ==================
+    def get(self, enemy_id_or_name):
+        """Équivalent de `WHERE id = ? OR nom = ?`, en mémoire."""
+        self.load()
+        enemy = self.by_id.get(enemy_id_or_name)
+        if enemy is None:
+            enemy = self.by_name.get(enemy_id_or_name)
+        if enemy is None and isinstance(enemy_id_or_name, str) and enemy_id_or_name.isdigit():
+            enemy = self.by_id.get(int(enemy_id_or_name))
+        return enemy
+
+    def names(self):
+        """Tous les noms, triés."""
+        self.load()
+        return [nom for _, nom in self._sorted_keys]
+
+    def search(self, texte, limit=None):
+        """
+        Noms correspondant à `texte` : d'abord ceux qui commencent par le
+        texte (recherche dichotomique), puis ceux qui le contiennent.
+        """
+        self.load()
+        requete = normaliser(texte)
+        if not requete:
+            return self.names()[:limit] if limit else self.names()
+
+        keys = self._sorted_keys
+        start = bisect.bisect_left(keys, (requete,))
+        prefixes = []
+        for cle, nom in keys[start:]:
+            if not cle.startswith(requete):
+                break
+            prefixes.append(nom)
+
+        trouves = set(prefixes)
+        contient = [nom for cle, nom in keys if requete in cle and nom not in trouves]
+
+        resultats = prefixes + contient
+        return resultats[:limit] if limit else resultats
+
+
+CATALOGUE = EnemyCatalog()
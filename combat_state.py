@@ -0,0 +1,268 @@
+"""
+État du combat en mémoire, avec persistance différée (write-behind).
+
+L'interface lit et modifie directement les lignes en mémoire ; un thread
+d'écriture recopie les lignes modifiées dans `session.ennemis_combat` par lots,
+dans une seule transaction, sur minuterie ou au-delà d'un seuil.
+"""
+import sqlite3
+import threading
+import time
+import atexit
+from database import connect_db
+from instrumentation import timed
+
+
+# Délai maximal (secondes) avant qu'une modification soit écrite sur disque
+FLUSH_INTERVAL = 1.0
+# Nombre de lignes modifiées déclenchant une écriture immédiate
+FLUSH_THRESHOLD = 32
+
+COMBAT_COLUMNS = ("id", "ennemi_source_id", "nom", "numero", "mouvement", "attaque",
+                  "pv", "pv_max", "elite", "image")
+
+
+class CombatStore:
+    """Source de vérité du combat en cours, partagée par JeuGUI et les cartes."""
+
+    def __init__(self, flush_interval=FLUSH_INTERVAL, flush_threshold=FLUSH_THRESHOLD):
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self._rows = {}
+        self._dirty = set()
+        self._deleted = set()
+        self._journal = []  # (horodatage, action, type, données JSON) à écrire
+        self._next_id = 1
+        self._lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._writer = None
+
+    # ================== CHARGEMENT ==================
+    def load(self):
+        """Charge les lignes existantes de `ennemis_combat` en mémoire."""
+        conn = connect_db()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f"SELECT {', '.join(COMBAT_COLUMNS)} FROM ennemis_combat")
+            rows = {row[0]: dict(zip(COMBAT_COLUMNS, row)) for row in cursor.fetchall()}
+        finally:
+            cursor.close()
+
+        with self._lock:
+            self._rows = rows
+            self._dirty.clear()
+            self._deleted.clear()
+            # Les IDs ne sont jamais réutilisés pendant une session
+            self._next_id = max(rows, default=0) + 1
+
+    # ================== LECTURE ==================
+    def get(self, enemy_id):
+        """Retourne la ligne vivante (dict) d'un ennemi, ou None."""
+        return self._rows.get(enemy_id)
+
+    def ids(self):
+        return list(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    # ================== MODIFICATIONS ==================
+    def add(self, data):
+        """Ajoute un ennemi au combat et retourne son ID."""
+        with self._lock:
+            enemy_id = self._next_id
+            self._next_id += 1
+            row = {col: data.get(col) for col in COMBAT_COLUMNS}
+            row["id"] = enemy_id
+            self._rows[enemy_id] = row
+            self._mark_dirty(enemy_id)
+        return enemy_id
+
+    def add_many(self, rows):
+        """
+        Ajoute un groupe d'ennemis et retourne leurs IDs. L'écriture est
+        demandée tout de suite : un seul executemany, une seule transaction.
+        """
+        with self._lock:
+            ids = [self.add(data) for data in rows]
+        self._wake.set()
+        return ids
+
+    def add_rows(self, rows):
+        """Réinsère des lignes complètes en gardant leurs IDs (annulation d'un retrait)."""
+        with self._lock:
+            for data in rows:
+                row = {col: data.get(col) for col in COMBAT_COLUMNS}
+                self._rows[row["id"]] = row
+                self._deleted.discard(row["id"])
+                self._dirty.add(row["id"])
+                self._next_id = max(self._next_id, row["id"] + 1)
+        self._wake.set()
+
+    def restore(self, rows):
+        """
+        Remplace tout le combat par des lignes sauvegardées (IDs conservés).
+        Tout est réécrit en un seul lot. Retourne les IDs dans l'ordre donné.
+        """
+        with self._lock:
+            self._deleted.update(self._rows)
+            self._rows = {}
+            # Modifications non écrites des anciennes lignes : remplacées par le lot
+            self._dirty = set()
+            for data in rows:
+                row = {col: data.get(col) for col in COMBAT_COLUMNS}
+                self._rows[row["id"]] = row
+                self._deleted.discard(row["id"])
+                self._dirty.add(row["id"])
+            self._next_id = max(self._next_id, max(self._rows, default=0) + 1)
+        self._wake.set()
+        return [data["id"] for data in rows]
+
+    def update(self, enemy_id, **fields):
+        """Modifie des champs d'une ligne ; l'écriture disque est différée."""
+        with self._lock:
+            row = self._rows[enemy_id]
+            row.update(fields)
+            self._mark_dirty(enemy_id)
+        return row
+
+    def set_pv(self, enemy_id, pv):
+        return self.update(enemy_id, pv=pv)
+
+    def set_pv_many(self, changes):
+        """
+        Applique un lot de PV {id: pv} d'un coup. L'écriture est demandée tout
+        de suite : tout le lot part dans une seule transaction.
+        """
+        with self._lock:
+            for enemy_id, pv in changes.items():
+                self._rows[enemy_id]["pv"] = pv
+                self._dirty.add(enemy_id)
+        self._wake.set()
+
+    def remove(self, enemy_id):
+        with self._lock:
+            if self._rows.pop(enemy_id, None) is not None:
+                self._dirty.discard(enemy_id)
+                self._deleted.add(enemy_id)
+                self._mark_dirty(None)
+
+    def remove_many(self, enemy_ids):
+        """Retire un lot d'ennemis ; les suppressions partent en une écriture."""
+        with self._lock:
+            for enemy_id in enemy_ids:
+                if self._rows.pop(enemy_id, None) is not None:
+                    self._dirty.discard(enemy_id)
+                    self._deleted.add(enemy_id)
+        self._wake.set()
+
+    def clear(self):
+        """Oublie toutes les lignes en mémoire, sans rien écrire."""
+        with self._lock:
+            self._rows.clear()
+            self._dirty.clear()
+            self._deleted.clear()
+            self._journal.clear()
+
+    def _mark_dirty(self, enemy_id):
+        if enemy_id is not None:
+            self._dirty.add(enemy_id)
+        if len(self._dirty) + len(self._deleted) + len(self._journal) >= self.flush_threshold:
+            self._wake.set()
+
+    # ================== JOURNAL ==================
+    def log_action(self, action, kind, donnees):
+        """Ajoute une entrée au journal ; écrite avec le prochain lot de lignes."""
+        with self._lock:
+            self._journal.append((time.time(), action, kind, donnees))
+            self._mark_dirty(None)
+
+    def load_journal(self):
+        """Entrées (action, type, données) du journal de la session, dans l'ordre."""
+        conn = connect_db()
+        try:
+            return conn.execute(
+                "SELECT action, type, donnees FROM journal_actions ORDER BY id"
+            ).fetchall()
+        except sqlite3.Error as e:
+            print(f"❌ Journal de session illisible : {e}")
+            return []
+
+    # ================== PERSISTANCE ==================
+    @timed("db.flush_combat")
+    def flush(self):
+        """Écrit toutes les lignes modifiées en une seule transaction."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty and not self._deleted and not self._journal:
+                    return 0
+                # Une ligne retirée entre-temps n'a plus rien à écrire
+                upserts = [tuple(self._rows[i][col] for col in COMBAT_COLUMNS)
+                           for i in self._dirty if i in self._rows]
+                deletes = [(i,) for i in self._deleted]
+                journal = self._journal
+                self._dirty.clear()
+                self._deleted.clear()
+                self._journal = []
+
+            conn = connect_db()
+            placeholders = ", ".join("?" for _ in COMBAT_COLUMNS)
+            try:
+                with conn:
+                    if deletes:
+                        conn.executemany("DELETE FROM ennemis_combat WHERE id = ?", deletes)
+                    if upserts:
+                        conn.executemany(
+                            f"INSERT OR REPLACE INTO ennemis_combat ({', '.join(COMBAT_COLUMNS)}) "
+                            f"VALUES ({placeholders})",
+                            upserts
+                        )
+                    if journal:
+                        conn.executemany(
+                            "INSERT INTO journal_actions (horodatage, action, type, donnees) "
+                            "VALUES (?, ?, ?, ?)",
+                            journal
+                        )
+            except sqlite3.Error as e:
+                print(f"❌ Erreur d'écriture du combat : {e}")
+                # On remet les lignes en attente pour la prochaine tentative
+                with self._lock:
+                    self._dirty.update(row[0] for row in upserts if row[0] in self._rows)
+                    self._deleted.update(row[0] for row in deletes)
+                    self._journal[:0] = journal
+                return 0
+            return len(upserts) + len(deletes) + len(journal)
+
+    def _run_writer(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                # Le thread d'écriture ne doit jamais mourir en silence
+                print(f"❌ Thread d'écriture du combat : {e!r}")
+
+    def start(self):
+        """Démarre le thread d'écriture en arrière-plan."""
+        if self._writer is not None and self._writer.is_alive():
+            return
+        self._stop.clear()
+        self._writer = threading.Thread(target=self._run_writer,
+                                        name="combat-writer", daemon=True)
+        self._writer.start()
+
+    def stop(self):
+        """Arrête le thread d'écriture puis écrit ce qui reste en attente."""
+        self._stop.set()
+        self._wake.set()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        self.flush()
+
+
+COMBAT_STORE = CombatStore()
+atexit.register(COMBAT_STORE.stop)
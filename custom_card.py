@@ -1,9 +1,17 @@
 import tkinter as tk
 from tkinter import ttk
 import os
-import cairosvg
+import io
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from PIL import Image, ImageTk
-from database import connect_db, get_ressource_ui
+from database import get_ressource_ui
+from combat_state import COMBAT_STORE
+from animation import AnimationScheduler
+from instrumentation import timed
 
 # ================== CONFIGURATION GLOBALE ==================
 SCALE_FACTOR = 0.8
@@ -26,15 +34,611 @@ SKULL_ICON_PATH = os.path.join(ICONS_DIR, "SKULL.png")
 REDLINE_RIGHT_TEXTURE_PATH = os.path.join(TEXTURES_DIR, "red_line_right.png")
 REDLINE_LEFT_TEXTURE_PATH = os.path.join(TEXTURES_DIR, "red_line_left.png")
 
+TITLE_FONT_FAMILY = "Dragon Hunter"
+
+# Fondu vers le gris : nombre d'étapes, et seuil de PV déclenchant
+# la préparation des frames en arrière-plan
+FADE_STEPS = 10
+FADE_PREFETCH_RATIO = 0.34
+
+# Durées des animations (secondes)
+FADE_DURATION = 0.55
+BRUSH_DURATION = 0.55
+
+# Tailles des assets d'une carte
+BG_SIZE = (int(395 * SCALE_FACTOR), int(550 * SCALE_FACTOR))
+ENEMY_SIZE = (int(CARD_WIDTH * 0.742), int(CARD_HEIGHT * 0.555))
+STAT_ICON_SIZE = (int(CARD_WIDTH * 0.1), int(CARD_WIDTH * 0.1))
+BUTTON_SIZE = (100, 100)
+HP_ICON_SIZE = (18, 18)
+
+# Préparation des cartes hors du thread Tk
+PREP_WORKERS = min(4, os.cpu_count() or 1)
+PREP_POLL_MS = 30
+
+# Budget mémoire du cache d'assets partagé (en octets)
+ASSET_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Budget global des images (assets + frames de fondu + couches statiques)
+IMAGE_MEMORY_BUDGET = 160 * 1024 * 1024
+
+# Cache disque des SVG rasterisés (clé = hash du contenu + taille de sortie)
+CACHE_DIR = os.path.join(BASE_DIR, ".cache")
+SVG_CACHE_DIR = os.path.join(CACHE_DIR, "svg")
+# Assets pré-rendus à la résolution des cartes (voir build_assets.py)
+BAKED_ASSETS_DIR = os.path.join(CACHE_DIR, "assets")
+
+# ================== RASTERISATION SVG ==================
+@timed("pil.rasterize_svg")
+def rasterize_svg(svg_path, size=None):
+    """
+    Rasterise un SVG en mémoire à la taille demandée et retourne une image PIL.
+    Le résultat est conservé dans SVG_CACHE_DIR : un démarrage à chaud
+    n'appelle jamais cairosvg.
+    """
+    with open(svg_path, "rb") as f:
+        svg_data = f.read()
+
+    digest = hashlib.sha1(svg_data).hexdigest()
+    size_tag = f"{size[0]}x{size[1]}" if size is not None else "natif"
+    cache_path = os.path.join(SVG_CACHE_DIR, f"{digest}_{size_tag}.png")
+
+    if os.path.exists(cache_path):
+        try:
+            img = Image.open(cache_path)
+            img.load()
+            return img
+        except OSError:
+            pass  # Fichier de cache corrompu : on le régénère
+
+    # Import différé : cairosvg (et libcairo) ne sont chargés qu'au premier SVG à rasteriser
+    import cairosvg
+
+    width, height = size if size is not None else (None, None)
+    png_data = cairosvg.svg2png(bytestring=svg_data,
+                                output_width=width, output_height=height)
+    img = Image.open(io.BytesIO(png_data))
+    img.load()
+
+    # Écriture atomique : deux cartes ne peuvent pas lire un fichier partiel
+    try:
+        os.makedirs(SVG_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(png_data)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"⚠️ Cache SVG non écrit ({cache_path}) : {e}")
+
+    return img
+
+# ================== ASSETS PRÉ-RENDUS ==================
+def render_asset(path, size=None):
+    """Décode (ou rasterise) une source et la redimensionne, sans passer par les caches."""
+    if path.lower().endswith(".svg"):
+        img = rasterize_svg(path, size)
+    else:
+        img = Image.open(path)
+    if size is not None and img.size != tuple(size):
+        img = img.resize(size, Image.LANCZOS)
+    img.load()
+    return img
+
+def baked_asset_path(path, size, variant="couleur"):
+    """
+    Fichier de la variante pré-rendue d'un asset. La clé contient la date de
+    modification de la source : une source modifiée n'est jamais servie périmée.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    stem = os.path.splitext(os.path.basename(path))[0]
+    source_tag = hashlib.sha1(os.path.relpath(path, BASE_DIR).encode("utf-8")).hexdigest()[:8]
+    return os.path.join(BAKED_ASSETS_DIR,
+                        f"{stem}_{source_tag}_{mtime}_{size[0]}x{size[1]}_{variant}.png")
+
+def load_baked_asset(path, size, variant="couleur"):
+    """Retourne la variante pré-rendue (image PIL), ou None si elle n'existe pas."""
+    if size is None:
+        return None
+    baked_path = baked_asset_path(path, size, variant)
+    if baked_path is None or not os.path.exists(baked_path):
+        return None
+    try:
+        img = Image.open(baked_path)
+        img.load()
+        return img
+    except OSError:
+        return None
+
+# ================== CACHE D'ASSETS PARTAGÉ ==================
+class AssetCache:
+    """
+    Cache LRU partagé par toutes les cartes, indexé par (chemin, taille, mode).
+    Chaque clé ne donne lieu qu'à un seul décodage / redimensionnement et
+    qu'à une seule ImageTk.PhotoImage, quel que soit le nombre de cartes.
+    """
+
+    def __init__(self, max_bytes=ASSET_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # clé -> {"image", "photo", "bytes"}
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _image_bytes(img):
+        """Estimation de la mémoire occupée par une image PIL."""
+        return img.width * img.height * len(img.getbands())
+
+    @timed("pil.load_asset")
+    def _load(self, path, size, mode):
+        """
+        Charge l'asset à la taille demandée (variante pré-rendue si elle existe,
+        sinon décodage + redimensionnement), puis applique le mode.
+        """
+        img = load_baked_asset(path, size)
+        if img is None:
+            img = render_asset(path, size)
+        if mode is not None and img.mode != mode:
+            img = img.convert(mode)
+        img.load()
+        return img
+
+    def _entry(self, path, size, mode):
+        key = (path, tuple(size) if size is not None else None, mode)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return key, entry
+            self.misses += 1
+
+        img = self._load(path, key[1], mode)
+        with self._lock:
+            # Un autre thread a pu charger la même clé entre-temps
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = {"image": img, "photo": None, "bytes": self._image_bytes(img)}
+                self._entries[key] = entry
+                self._bytes += entry["bytes"]
+                self._evict()
+            return key, entry
+
+    def _evict(self):
+        """Retire les entrées les moins récemment utilisées au-delà du budget."""
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry["bytes"]
+
+    def contains(self, path, size=None, mode="RGBA"):
+        """Indique si la clé est en cache (sans toucher aux compteurs ni à l'ordre LRU)."""
+        key = (path, tuple(size) if size is not None else None, mode)
+        with self._lock:
+            return key in self._entries
+
+    def get_image(self, path, size=None, mode="RGBA"):
+        """Retourne l'image PIL partagée (à ne pas modifier en place)."""
+        return self._entry(path, size, mode)[1]["image"]
+
+    def get_photo(self, path, size=None, mode="RGBA"):
+        """Retourne l'ImageTk.PhotoImage partagée (thread Tk uniquement)."""
+        key, entry = self._entry(path, size, mode)
+        if entry["photo"] is None:
+            img = entry["image"]
+            entry["photo"] = ImageTk.PhotoImage(img)
+            # Tk garde sa propre copie RGBA des pixels
+            photo_bytes = img.width * img.height * 4
+            with self._lock:
+                entry["bytes"] += photo_bytes
+                if self._entries.get(key) is entry:
+                    self._bytes += photo_bytes
+                    self._evict()
+        return entry["photo"]
+
+    def configure(self, max_bytes):
+        """Modifie le budget mémoire et évince si nécessaire."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """Compteurs de hits/misses et occupation mémoire."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+ASSET_CACHE = AssetCache()
+
+# ================== FRAMES DE FONDU PARTAGÉES ==================
+class FadeFrameCache:
+    """
+    Frames du fondu couleur -> gris d'une source (fond ou portrait), indexées
+    par (source, taille, nb d'étapes). Elles ne servent qu'à composer les
+    frames des couches statiques (StaticLayerCache), qui les oublient ensuite.
+    """
+
+    def __init__(self):
+        self._frames = {}   # clé -> [Image PIL par étape]
+        self._lock = threading.Lock()
+
+    @staticmethod
+    @timed("pil.fade_frames")
+    def _build(path, size, steps):
+        color = ASSET_CACHE.get_image(path, size)
+        gray = load_baked_asset(path, size, "gris")
+        if gray is None or gray.size != color.size:
+            gray = color.convert("L")
+        gray = gray.convert("RGBA")
+        # Le gris garde la transparence de l'original (coins arrondis du portrait)
+        gray.putalpha(color.getchannel("A"))
+        return [Image.blend(color, gray, step / float(steps)) for step in range(steps + 1)]
+
+    def frames(self, path, size, steps=FADE_STEPS):
+        """Retourne les frames PIL (calculées au premier appel)."""
+        key = (path, tuple(size), steps)
+        with self._lock:
+            frames = self._frames.get(key)
+        if frames is not None:
+            return frames
+
+        frames = self._build(path, key[1], steps)
+        with self._lock:
+            return self._frames.setdefault(key, frames)
+
+    def discard(self, path, size, steps=FADE_STEPS):
+        """Oublie les frames d'une source (recalculées si on les redemande)."""
+        key = (path, tuple(size), steps)
+        with self._lock:
+            self._frames.pop(key, None)
+
+    def bytes(self):
+        with self._lock:
+            return sum(f.width * f.height * 4 for frames in self._frames.values() for f in frames)
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+
+
+FADE_CACHE = FadeFrameCache()
+
+# ================== COUCHES STATIQUES PARTAGÉES ==================
+def static_layer_key(enemy):
+    """Type d'ennemi au sens de l'affichage : tout ce qui fixe la couche statique."""
+    return (enemy["nom"].replace(" ELITE", ""), bool(enemy["elite"]), enemy["image"],
+            enemy["mouvement"], enemy["attaque"], SCALE_FACTOR)
+
+class StaticLayerCache:
+    """
+    Partie fixe des cartes (fond, titre, stats, portrait) composée une seule
+    fois par type d'ennemi et partagée par toutes ses cartes, avec ses
+    frames de fondu vers le gris et son état mort (gris + croix rouge).
+    Composition PIL sur n'importe quel thread ; PhotoImage créées sur le
+    thread Tk uniquement.
+
+    Les frames du fondu ne vivent que tant qu'une carte du type peut mourir
+    bientôt (PV bas) ou est en train de mourir : chaque carte s'enregistre
+    avec want_fade() et se retire avec drop_fade().
+    """
+
+    def __init__(self):
+        self._layers = OrderedDict()  # clé -> Image PIL (ordre LRU)
+        self._photos = {}             # clé -> PhotoImage
+        self._dead = {}               # clé -> Image PIL de l'état mort
+        self._dead_photos = {}        # clé -> PhotoImage de l'état mort
+        self._frames = {}             # (clé, étapes) -> [Image PIL par étape]
+        self._frame_photos = {}
+        self._pending = {}            # (clé, étapes) -> Future
+        self._fade_users = {}         # (clé, étapes) -> {id(carte)}
+        self._lock = threading.RLock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="layer-fade")
+
+    @staticmethod
+    def _compose(enemy, fade_step=0, steps=FADE_STEPS):
+        # Import différé : headless_render dépend de ce module
+        from headless_render import compose_static_layer
+        return compose_static_layer(enemy, fade_step, steps)
+
+    @staticmethod
+    def _discard_sources(enemy, steps=FADE_STEPS):
+        """Les frames grises des sources ne servent qu'à composer les couches."""
+        FADE_CACHE.discard(background_path(enemy), BG_SIZE, steps)
+        FADE_CACHE.discard(portrait_path(enemy), ENEMY_SIZE, steps)
+
+    def contains(self, enemy, dead=False):
+        """Couche (ou état mort si `dead`) déjà composée pour ce type ?"""
+        with self._lock:
+            return static_layer_key(enemy) in (self._dead if dead else self._layers)
+
+    def image(self, enemy):
+        """Couche statique en couleur (composée au premier appel pour ce type)."""
+        key = static_layer_key(enemy)
+        with self._lock:
+            layer = self._layers.get(key)
+            if layer is not None:
+                self._layers.move_to_end(key)
+                return layer
+        layer = self._compose(enemy)
+        with self._lock:
+            return self._layers.setdefault(key, layer)
+
+    def photo(self, enemy):
+        key = static_layer_key(enemy)
+        photo = self._photos.get(key)
+        if photo is None:
+            photo = self._photos[key] = ImageTk.PhotoImage(self.image(enemy))
+        return photo
+
+    # ================== FONDU ==================
+    def _build_frames(self, enemy, steps):
+        layer = self.image(enemy)
+        frames = [layer]
+        try:
+            for step in range(1, steps + 1):
+                frames.append(self._compose(enemy, step, steps))
+        finally:
+            # Une seule fois, après toutes les étapes (sinon recalcul à chaque étape)
+            self._discard_sources(enemy, steps)
+        return frames
+
+    def want_fade(self, enemy, owner, steps=FADE_STEPS):
+        """`owner` peut bientôt mourir : frames du fondu gardées et préparées en arrière-plan."""
+        fkey = (static_layer_key(enemy), steps)
+        with self._lock:
+            self._fade_users.setdefault(fkey, set()).add(id(owner))
+            if fkey in self._frames or fkey in self._pending:
+                return
+            self._pending[fkey] = self._executor.submit(self._build_frames, dict(enemy), steps)
+
+    def fade_ready(self, enemy, steps=FADE_STEPS):
+        """Frames du fondu disponibles sans attendre (déjà construites) ?"""
+        fkey = (static_layer_key(enemy), steps)
+        with self._lock:
+            if fkey in self._frames:
+                return True
+            future = self._pending.get(fkey)
+        return future is not None and future.done()
+
+    def drop_fade(self, enemy, owner, steps=FADE_STEPS):
+        """`owner` n'a plus besoin du fondu ; libère les frames si plus personne n'en a besoin."""
+        fkey = (static_layer_key(enemy), steps)
+        with self._lock:
+            users = self._fade_users.get(fkey)
+            if users is None:
+                return
+            users.discard(id(owner))
+            if not users:
+                del self._fade_users[fkey]
+                self._frames.pop(fkey, None)
+                self._frame_photos.pop(fkey, None)
+                future = self._pending.pop(fkey, None)
+                if future is not None:
+                    future.cancel()
+
+    def fade_frames(self, enemy, steps=FADE_STEPS):
+        """
+        Frames PIL du fondu (0 = couleur, steps = gris). Utilisable sans carte
+        (rendu headless, banc de mesure) : les frames ne sont alors pas gardées.
+        """
+        fkey = (static_layer_key(enemy), steps)
+        with self._lock:
+            frames = self._frames.get(fkey)
+            future = self._pending.get(fkey)
+        if frames is not None:
+            return frames
+
+        frames = future.result() if future is not None else self._build_frames(enemy, steps)
+        with self._lock:
+            self._pending.pop(fkey, None)
+            # Gardées uniquement si une carte en a encore besoin
+            if fkey in self._fade_users:
+                frames = self._frames.setdefault(fkey, frames)
+            return frames
+
+    def fade_photos(self, enemy, steps=FADE_STEPS):
+        """PhotoImage partagées des frames du fondu (thread Tk uniquement)."""
+        fkey = (static_layer_key(enemy), steps)
+        photos = self._frame_photos.get(fkey)
+        if photos is None:
+            photos = [ImageTk.PhotoImage(frame) for frame in self.fade_frames(enemy, steps)]
+            if fkey in self._fade_users:
+                self._frame_photos[fkey] = photos
+        return photos
+
+    # ================== ÉTAT MORT ==================
+    def dead_image(self, enemy):
+        """Couche de l'état final : dernière frame grise et croix rouge, en une image."""
+        key = static_layer_key(enemy)
+        with self._lock:
+            dead = self._dead.get(key)
+            frames = self._frames.get((key, FADE_STEPS))
+        if dead is not None:
+            return dead
+
+        from headless_render import draw_death
+        if frames:
+            dead = frames[-1].copy()
+        else:
+            dead = self._compose(enemy, FADE_STEPS)
+            self._discard_sources(enemy)
+        draw_death(dead)
+        with self._lock:
+            return self._dead.setdefault(key, dead)
+
+    def dead_photo(self, enemy):
+        key = static_layer_key(enemy)
+        photo = self._dead_photos.get(key)
+        if photo is None:
+            photo = self._dead_photos[key] = ImageTk.PhotoImage(self.dead_image(enemy))
+        return photo
+
+    # ================== MÉMOIRE ==================
+    def bytes(self):
+        """Mémoire estimée des images gardées (PIL + copies Tk, 4 octets par pixel)."""
+        def size(img):
+            return img.width * img.height * 4
+        with self._lock:
+            total = sum(map(size, self._layers.values())) + sum(map(size, self._dead.values()))
+            total += sum(size(f) for frames in self._frames.values() for f in frames)
+            total += sum(p.width() * p.height() * 4 for p in self._photos.values())
+            total += sum(p.width() * p.height() * 4 for p in self._dead_photos.values())
+            total += sum(p.width() * p.height() * 4
+                         for photos in self._frame_photos.values() for p in photos)
+        return total
+
+    def trim(self, max_bytes, keep=()):
+        """
+        Évince les types les moins récemment utilisés jusqu'à passer sous
+        max_bytes. Les types de `keep` (cartes affichées) et ceux en cours de
+        fondu sont conservés ; les cartes gardent de toute façon leur PhotoImage.
+        """
+        keep = set(keep) | {fkey[0] for fkey in self._fade_users}
+        with self._lock:
+            for key in list(self._layers):
+                if self.bytes() <= max_bytes:
+                    break
+                if key in keep:
+                    continue
+                del self._layers[key]
+                self._photos.pop(key, None)
+                self._dead.pop(key, None)
+                self._dead_photos.pop(key, None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "types": len(self._layers),
+                "fading_types": len(self._fade_users),
+                "dead_layers": len(self._dead),
+                "bytes": self.bytes(),
+            }
+
+    def clear(self):
+        with self._lock:
+            self._layers.clear()
+            self._photos.clear()
+            self._dead.clear()
+            self._dead_photos.clear()
+            self._frames.clear()
+            self._frame_photos.clear()
+
+
+STATIC_LAYERS = StaticLayerCache()
+
+# ================== BUDGET MÉMOIRE GLOBAL ==================
+def image_memory():
+    """Octets d'images gardés par chaque cache, et total."""
+    usage = {
+        "assets": ASSET_CACHE.stats()["bytes"],
+        "fade_sources": FADE_CACHE.bytes(),
+        "static_layers": STATIC_LAYERS.bytes(),
+    }
+    usage["total"] = sum(usage.values())
+    usage["budget"] = IMAGE_MEMORY_BUDGET
+    return usage
+
+def enforce_image_budget(displayed=()):
+    """
+    Ramène les caches sous IMAGE_MEMORY_BUDGET : d'abord les frames grises
+    des sources (recalculables), puis les couches des types non affichés.
+    `displayed` : ennemis dont une carte est à l'écran.
+    """
+    usage = image_memory()
+    if usage["total"] <= IMAGE_MEMORY_BUDGET:
+        return usage
+    FADE_CACHE.clear()
+    STATIC_LAYERS.trim(IMAGE_MEMORY_BUDGET - usage["assets"],
+                       keep={static_layer_key(enemy) for enemy in displayed})
+    return image_memory()
+
+# ================== PRÉPARATION HORS THREAD TK ==================
+CARD_PREP_POOL = ThreadPoolExecutor(max_workers=PREP_WORKERS, thread_name_prefix="card-prep")
+
+def background_path(enemy):
+    return PAPYRUS_ELITE_TEXTURE_PATH if enemy["elite"] else PAPYRUS_NORMAL_TEXTURE_PATH
+
+def portrait_path(enemy):
+    return os.path.join(ENNEMIS_DIR, enemy["image"])
+
+def card_asset_specs(enemy):
+    """(chemin, taille, mode) de chaque image PIL nécessaire à une carte."""
+    return [
+        (background_path(enemy), BG_SIZE, "RGBA"),
+        (portrait_path(enemy), ENEMY_SIZE, "RGBA"),
+        (ICON_BOOTS_PATH, STAT_ICON_SIZE, None),
+        (ICON_ATTACK_PATH, STAT_ICON_SIZE, "RGBA"),
+        (HP_DOWN_PATH, BUTTON_SIZE, "RGBA"),
+        (HP_UP_PATH, BUTTON_SIZE, "RGBA"),
+        (ICON_HP_PATH, HP_ICON_SIZE, None),
+        (SKULL_ICON_PATH, HP_ICON_SIZE, None),
+    ]
+
+def card_widget_specs():
+    """(chemin, taille, mode) des images affichées hors de la couche statique."""
+    return [
+        (HP_DOWN_PATH, BUTTON_SIZE, "RGBA"),
+        (HP_UP_PATH, BUTTON_SIZE, "RGBA"),
+        (ICON_HP_PATH, HP_ICON_SIZE, None),
+        (SKULL_ICON_PATH, HP_ICON_SIZE, None),
+    ]
+
+def prepare_card_assets(enemy):
+    """Phase « thread » : composition de la couche statique, boutons et icônes PV."""
+    STATIC_LAYERS.image(enemy)
+    for spec in card_widget_specs():
+        ASSET_CACHE.get_image(*spec)
+    # Ennemi déjà mort (combat restauré) : l'état final sera affiché directement
+    if enemy["pv"] == 0:
+        STATIC_LAYERS.dead_image(enemy)
+
+def card_assets_ready(enemy):
+    """Vrai si la phase Tk peut dessiner la carte sans aucun travail PIL."""
+    return (STATIC_LAYERS.contains(enemy)
+            and (enemy["pv"] > 0 or STATIC_LAYERS.contains(enemy, dead=True))
+            and all(ASSET_CACHE.contains(*spec) for spec in card_widget_specs()))
+
+_prep_futures = {}
+_prep_lock = threading.Lock()
+
+def submit_card_preparation(enemy):
+    """
+    Lance la préparation des images d'une carte dans le pool. Les cartes
+    d'un même type partagent la même tâche.
+    """
+    key = (static_layer_key(enemy), enemy["pv"] == 0)
+    with _prep_lock:
+        future = _prep_futures.get(key)
+        if future is None or (future.done() and not card_assets_ready(enemy)):
+            future = CARD_PREP_POOL.submit(prepare_card_assets, dict(enemy))
+            _prep_futures[key] = future
+        return future
+
+def prepare_cards(enemies):
+    """Prépare en lot les images d'un groupe d'ennemis (une tâche par type)."""
+    return [submit_card_preparation(enemy) for enemy in enemies
+            if not card_assets_ready(enemy)]
+
 def load_svg_as_png(svg_path, size=(31, 31)):
     """
-    Convertit un fichier SVG en PNG, puis le charge en ImageTk.PhotoImage.
+    Rasterise un fichier SVG et le retourne en ImageTk.PhotoImage partagée.
     """
-    png_path = svg_path.replace(".svg", ".png")
-    cairosvg.svg2png(url=svg_path, write_to=png_path,
-                     output_width=size[0], output_height=size[1])
-    img = Image.open(png_path).resize(size, Image.LANCZOS)
-    return ImageTk.PhotoImage(img)
+    return ASSET_CACHE.get_photo(svg_path, size)
 
 def multi_stop_gradient(ratio):
     """
@@ -74,20 +678,35 @@ def multi_stop_gradient(ratio):
 
     return None
 
+@lru_cache(maxsize=None)
+def hp_gradient_table(pv_max):
+    """
+    Table précalculée des couleurs de barre de vie pour un pv_max donné :
+    table[pv] = couleur hexadécimale (ou None si pv <= 0).
+    """
+    if pv_max <= 0:
+        return (None,)
+    return tuple(multi_stop_gradient(pv / pv_max) for pv in range(pv_max + 1))
+
 class CarteEnnemi(tk.Frame):
-    def __init__(self, parent, enemy_id):
-        super().__init__(parent)
-        self.enemy = self.get_enemy_combat_data(enemy_id)
-        if not self.enemy:
-            raise ValueError(f"Ennemi ID {enemy_id} introuvable dans `ennemis_combat`.")
+    # Image vide partagée affichée à la place des boutons pendant la préparation
+    blank_button_tk = None
 
+    def __init__(self, parent, enemy_id, scheduler=None, on_hp_change=None):
+        super().__init__(parent)
+        self.enemy = None
+        # Rappel (id, ancien, nouveau) après un clic - / + (historique d'annulation)
+        self.on_hp_change = on_hp_change
         self.width, self.height = CARD_WIDTH, CARD_HEIGHT
 
-        # Attributs pour gérer le fade to gray
-        self.bg_color_img = None
-        self.bg_gray_img = None
-        self.enemy_img_color = None
-        self.enemy_img_gray = None
+        # Élément du canvas affichant la couche statique partagée
+        self.layer_id = None
+        self.layer_tk = None
+        self.brush1_tk = self.brush2_tk = None
+        self.brush1_id = self.brush2_id = None
+
+        # Ordonnanceur d'animations partagé (celui de JeuGUI en général)
+        self.scheduler = scheduler or AnimationScheduler(self)
 
         # ================== FRAME GLOBAL ==================
         self.frame_global = ttk.Frame(self)
@@ -106,236 +725,327 @@ class CarteEnnemi(tk.Frame):
         self.button_container.columnconfigure(0, weight=1)
         self.button_container.columnconfigure(1, weight=1)
 
-        # Boutons - / +
-        button_size = (100, 100)
-        self.hp_down_tk = load_svg_as_png(HP_DOWN_PATH, size=button_size)
-        self.hp_up_tk = load_svg_as_png(HP_UP_PATH, size=button_size)
+        # Boutons - / + (image vide de même taille tant que la carte se prépare)
+        if CarteEnnemi.blank_button_tk is None:
+            CarteEnnemi.blank_button_tk = tk.PhotoImage(width=BUTTON_SIZE[0], height=BUTTON_SIZE[1])
 
-        self.hp_down = tk.Label(self.button_container, image=self.hp_down_tk,
+        self.hp_down = tk.Label(self.button_container, image=CarteEnnemi.blank_button_tk,
                                 cursor="hand2", highlightthickness=0, borderwidth=0)
         self.hp_down.grid(row=0, column=0, padx=5, pady=5, sticky="e")
         self.hp_down.bind("<Button-1>", self.decrement_hp)
 
-        self.hp_up = tk.Label(self.button_container, image=self.hp_up_tk,
+        self.hp_up = tk.Label(self.button_container, image=CarteEnnemi.blank_button_tk,
                               cursor="hand2", highlightthickness=0, borderwidth=0)
         self.hp_up.grid(row=0, column=1, padx=5, pady=5, sticky="w")
         self.hp_up.bind("<Button-1>", self.increment_hp)
 
-        # Icônes PV / crâne
-        self.icon_hp_tk = ImageTk.PhotoImage(Image.open(ICON_HP_PATH).resize((18, 18), Image.LANCZOS))
-        self.icon_skull_tk = ImageTk.PhotoImage(Image.open(SKULL_ICON_PATH).resize((18, 18), Image.LANCZOS))
-
         # ================== DESSIN DE LA CARTE ==================
-        self.draw_background()
-        self.draw_title()
-        self.draw_stats()
-        self.draw_enemy()
-        self.draw_hp_bar()
+        self.selected = False
+        self.ready = False
+        self.prep_future = None
+        self.bind_enemy(enemy_id)
 
-    # ================== BDD ==================
-    def get_enemy_combat_data(self, ennemi_id):
-        conn = connect_db()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM ennemis_combat WHERE id = ?", (ennemi_id,))
-        row = cursor.fetchone()
-        conn.close()
+    # ================== RECYCLAGE ==================
+    def bind_enemy(self, enemy_id):
+        """
+        (Re)lie la carte à une ligne du combat et redessine le canvas.
+        Les widgets Tk sont conservés : une carte sortie du champ de
+        bataille peut ainsi être réutilisée pour un autre ennemi.
+        """
+        enemy = self.get_enemy_combat_data(enemy_id)
+        if not enemy:
+            raise ValueError(f"Ennemi ID {enemy_id} introuvable dans `ennemis_combat`.")
 
-        if not row:
-            print(f"❌ Erreur: Ennemi ID {ennemi_id} introuvable dans `ennemis_combat`.")
-            return None
+        self.cancel_animations()
+        self.release_images()
+        self.enemy = enemy
+        self.ready = False
+        self.prep_future = None
 
-        keys = ["id", "nom", "numero", "mouvement", "attaque", "pv", "pv_max", "elite", "image"]
-        enemy_dict = dict(zip(keys, row))
-        # Supprimer " ELITE" du nom si présent
-        enemy_dict["nom"] = enemy_dict["nom"].replace(" ELITE", "")
-        return enemy_dict
-
-    # ================== FOND ==================
-    def draw_background(self):
-        """Charge et stocke la version couleur + gris du fond papyrus en RGBA."""
-        if self.enemy["elite"]:
-            bg_path = PAPYRUS_ELITE_TEXTURE_PATH
+        if card_assets_ready(enemy):
+            self.draw_card()
         else:
-            bg_path = PAPYRUS_NORMAL_TEXTURE_PATH
-
-        papyrus_img_color = Image.open(bg_path).resize(
-            (int(395 * SCALE_FACTOR), int(550 * SCALE_FACTOR)),
-            Image.LANCZOS
-        ).convert("RGBA")
+            # Images à préparer : placeholder immédiat, travail PIL dans le pool
+            self.draw_placeholder()
+            self.prep_future = submit_card_preparation(enemy)
+            self.after(PREP_POLL_MS, self.poll_preparation, self.prep_future)
+
+    def poll_preparation(self, future):
+        """Attend (sans bloquer Tk) la fin de la préparation des images."""
+        if future is not self.prep_future or not self.winfo_exists():
+            return  # Carte recyclée ou détruite entre-temps
+        if not future.done():
+            self.after(PREP_POLL_MS, self.poll_preparation, future)
+            return
 
-        papyrus_img_gray = papyrus_img_color.convert("L").convert("RGBA")
+        self.prep_future = None
+        error = future.exception()
+        if error is not None:
+            # Repli : préparation synchrone, puis état d'erreur si elle échoue aussi
+            print(f"⚠️ Préparation en arrière-plan de la carte #{self.enemy['id']} "
+                  f"échouée ({error!r}) : nouvel essai sur le thread Tk.")
+            try:
+                prepare_card_assets(self.enemy)
+                self.draw_card()
+            except Exception as e:
+                print(f"❌ Erreur de préparation de la carte #{self.enemy['id']} : {e!r}")
+                self.draw_error()
+            return
+        self.draw_card()
+
+    @timed("card.draw_card")
+    def draw_card(self):
+        """Phase Tk : PhotoImage partagées et éléments du canvas uniquement."""
+        self.canvas.delete("all")
+
+        # Éléments persistants de la barre de vie (créés au premier dessin)
+        self.hp_fill_id = None
+        self.hp_icon_id = None
+        self.hp_text_id = None
+        self.hp_bar_state = None
+        self.fade_step = None
+
+        # Boutons - / + et icônes PV / crâne
+        self.hp_down_tk = load_svg_as_png(HP_DOWN_PATH, size=BUTTON_SIZE)
+        self.hp_up_tk = load_svg_as_png(HP_UP_PATH, size=BUTTON_SIZE)
+        self.hp_down.configure(image=self.hp_down_tk)
+        self.hp_up.configure(image=self.hp_up_tk)
+        self.icon_hp_tk = ASSET_CACHE.get_photo(ICON_HP_PATH, HP_ICON_SIZE, None)
+        self.icon_skull_tk = ASSET_CACHE.get_photo(SKULL_ICON_PATH, HP_ICON_SIZE, None)
+
+        self.draw_static_layer()
+        self.draw_id()
+        self.draw_hp_bar()
+        self.draw_selection()
+        self.ready = True
 
-        self.bg_color_img = papyrus_img_color
-        self.bg_gray_img = papyrus_img_gray
+        # Ennemi déjà mort : état final directement, sans animation
+        if self.enemy["pv"] == 0:
+            self.show_dead()
 
-        self.bg_tk = ImageTk.PhotoImage(self.bg_color_img)
-        self.bg_id = self.canvas.create_image(
-            self.width * 0.5, self.height * 0.5,
-            anchor="center", image=self.bg_tk
+    def draw_placeholder(self):
+        """Carte provisoire légère affichée pendant la préparation des images."""
+        self.canvas.delete("all")
+        self.layer_id = None
+        self.canvas.create_rectangle(
+            self.width * 0.02, self.height * 0.02,
+            self.width * 0.98, self.height * 0.98,
+            outline="#FFD700" if self.enemy["elite"] else "#8a8a8a",
+            width=2, fill="#3a3a3a"
         )
-
-    # ================== TITRE ==================
-    def draw_title(self):
-        """Affiche le titre centré, avec contour noir et couleur dorée/blanche."""
-        title_color = "#FFD700" if self.enemy["elite"] else "white"
-        max_width = self.width * 0.85
-        font_size = int(self.width * 0.06)
-        min_font_size = int(self.width * 0.04)
-
-        while True:
-            font = ("Dragon Hunter", font_size)
-            text_id = self.canvas.create_text(0, 0, text=self.enemy["nom"], font=font, anchor="nw")
-            text_width = self.canvas.bbox(text_id)[2] - self.canvas.bbox(text_id)[0]
-            self.canvas.delete(text_id)
-            if text_width <= max_width or font_size <= min_font_size:
-                break
-            font_size -= 1
-
-        x_center = self.width * 0.5
-        y_position = self.height * 0.08
-
-        # Contour noir
-        outline_offset = 1
-        for dx, dy in [(-outline_offset, 0), (outline_offset, 0),
-                       (0, -outline_offset), (0, outline_offset)]:
-            self.canvas.create_text(
-                x_center + dx, y_position + dy,
-                text=self.enemy["nom"], font=font,
-                fill="black", anchor="center"
-            )
-
-        # Titre principal
         self.canvas.create_text(
-            x_center, y_position,
-            text=self.enemy["nom"], font=font,
-            fill=title_color, anchor="center"
+            self.width * 0.5, self.height * 0.08,
+            text=self.titre, font=(TITLE_FONT_FAMILY, int(self.width * 0.05)),
+            fill="white", anchor="center"
         )
-
-        # ID sous le titre (optionnel)
         self.canvas.create_text(
-            x_center, self.height * 0.11,
-            text=f"#{self.enemy['id']}",
-            font=("Maitree SemiBold", int(self.width * 0.035)),
-            fill="black", anchor="n"
+            self.width * 0.5, self.height * 0.5,
+            text="Chargement…", font=("Maitree SemiBold", 12),
+            fill="#b0b0b0", anchor="center"
         )
 
-    # ================== STATS ==================
-    def draw_stats(self):
-        """Affiche les icônes mouvement/attaque et leurs valeurs."""
-        icon_size = int(self.width * 0.1)
-        icon_boots = Image.open(ICON_BOOTS_PATH).resize((icon_size, icon_size), Image.LANCZOS)
-        self.icon_boots_tk = ImageTk.PhotoImage(icon_boots)
-
-        self.icon_attack_tk = load_svg_as_png(ICON_ATTACK_PATH, size=(icon_size, icon_size))
-
-        # Icône mouvement
-        self.canvas.create_image(self.width * 0.3, self.height * 0.19,
-                                 anchor="nw", image=self.icon_boots_tk)
-        # Icône attaque
-        self.canvas.create_image(self.width * 0.55, self.height * 0.19,
-                                 anchor="nw", image=self.icon_attack_tk)
-
-        # Valeurs
+    def draw_error(self):
+        """Carte dont les images n'ont pas pu être préparées (fichier manquant, etc.)."""
+        self.ready = False
+        self.canvas.delete("all")
+        self.layer_id = None
+        self.canvas.create_rectangle(
+            self.width * 0.02, self.height * 0.02,
+            self.width * 0.98, self.height * 0.98,
+            outline="#B22222", width=2, fill="#3a3a3a"
+        )
         self.canvas.create_text(
-            self.width * 0.428, self.height * 0.18,
-            anchor="nw",
-            text=f"{self.enemy['mouvement']}",
-            font=("Maitree SemiBold", int(self.width * 0.06)),
-            fill="black"
+            self.width * 0.5, self.height * 0.08,
+            text=f"{self.titre} #{self.enemy['id']}",
+            font=(TITLE_FONT_FAMILY, int(self.width * 0.05)),
+            fill="white", anchor="center"
         )
         self.canvas.create_text(
-            self.width * 0.658, self.height * 0.18,
-            anchor="nw",
-            text=f"{self.enemy['attaque']}",
-            font=("Maitree SemiBold", int(self.width * 0.06)),
-            fill="black"
+            self.width * 0.5, self.height * 0.5,
+            text="Images introuvables", font=("Maitree SemiBold", 12),
+            fill="#ff6b6b", anchor="center"
         )
 
-    # ================== ENNEMI ==================
-    def draw_enemy(self):
-        """Charge et stocke la version couleur + gris de l'ennemi en RGBA."""
-        enemy_img_path = os.path.join(ENNEMIS_DIR, self.enemy["image"])
-        enemy_img_color = Image.open(enemy_img_path).resize(
-            (int(CARD_WIDTH * 0.742), int(CARD_HEIGHT * 0.555)),
-            Image.LANCZOS
-        ).convert("RGBA")
+    def cancel_animations(self):
+        self.scheduler.cancel_owner(self)
+
+    # ================== MÉMOIRE ==================
+    def release_images(self):
+        """Rend les images partagées tenues par la carte (frames de fondu, brosses)."""
+        if self.enemy is not None:
+            STATIC_LAYERS.drop_fade(self.enemy, self)
+        self.layer_tk = None
+        self.brush1_tk = self.brush2_tk = None
+        self.brush1_id = self.brush2_id = None
+
+    def park(self):
+        """Carte mise au repos dans le pool : canvas vidé, aucune image retenue."""
+        self.cancel_animations()
+        self.prep_future = None
+        self.ready = False
+        self.canvas.delete("all")
+        self.layer_id = None
+        self.release_images()
+
+    def destroy(self):
+        self.cancel_animations()
+        self.release_images()
+        super().destroy()
+
+    def image_bytes(self):
+        """Octets des images affichées par la carte (copies Tk, 4 octets par pixel)."""
+        return sum(photo.width() * photo.height() * 4
+                   for photo in (self.layer_tk, self.brush1_tk, self.brush2_tk)
+                   if photo is not None)
 
-        enemy_img_gray = enemy_img_color.convert("L").convert("RGBA")
+    # ================== BDD ==================
+    def get_enemy_combat_data(self, ennemi_id):
+        """Retourne la ligne vivante de l'ennemi dans le magasin de combat."""
+        enemy = COMBAT_STORE.get(ennemi_id)
 
-        self.enemy_img_color = enemy_img_color
-        self.enemy_img_gray = enemy_img_gray
+        if not enemy:
+            print(f"❌ Erreur: Ennemi ID {ennemi_id} introuvable dans `ennemis_combat`.")
+            return None
 
-        self.enemy_img_tk = ImageTk.PhotoImage(self.enemy_img_color)
-        self.enemy_img_id = self.canvas.create_image(
-            self.width * 0.5, self.height * 0.57,
-            anchor="center", image=self.enemy_img_tk
+        # Supprimer " ELITE" du nom affiché si présent
+        self.titre = enemy["nom"].replace(" ELITE", "")
+        return enemy
+
+    # ================== COUCHE STATIQUE ==================
+    @timed("card.draw_static_layer")
+    def draw_static_layer(self):
+        """
+        Fond, titre, stats et portrait : une seule image, composée une fois
+        par type d'ennemi et partagée par toutes ses cartes.
+        """
+        self.layer_tk = STATIC_LAYERS.photo(self.enemy)
+        self.layer_id = self.canvas.create_image(
+            self.width * 0.5, self.height * 0.5,
+            anchor="center", image=self.layer_tk
+        )
+
+    def draw_id(self):
+        """ID sous le titre (seul texte propre à chaque carte)."""
+        self.canvas.create_text(
+            self.width * 0.5, self.height * 0.11,
+            text=f"#{self.enemy['id']}",
+            font=("Maitree SemiBold", int(self.width * 0.035)),
+            fill="black", anchor="n"
         )
 
     # ================== BARRE DE VIE ==================
+    @timed("card.draw_hp_bar")
     def draw_hp_bar(self):
-        """Dessine la barre de vie avec un gradient multi-stop, plus crâne si PV=0."""
+        """
+        Dessine la barre de vie avec un gradient multi-stop, plus crâne si PV=0.
+        Les éléments du canvas sont créés une seule fois ; les appels suivants
+        ne font que des coords/itemconfig.
+        """
         bar_x, bar_y = self.width * 0.15, self.height * 0.87
         bar_width, bar_height = self.width * 0.7, self.height * 0.05
 
-        hp_ratio = self.enemy["pv"] / self.enemy["pv_max"] if self.enemy["pv_max"] else 0
-        bar_color = multi_stop_gradient(hp_ratio)
-
-        # Supprime l'ancienne barre
-        self.canvas.delete("hp_bar")
-
-        # Remplissage si PV > 0
-        if self.enemy["pv"] > 0 and bar_color is not None:
-            self.canvas.create_rectangle(
-                bar_x, bar_y,
-                bar_x + (bar_width * hp_ratio), bar_y + bar_height,
-                outline="", width=0, fill=bar_color, tags="hp_bar"
-            )
+        pv, pv_max = self.enemy["pv"], self.enemy["pv_max"]
+        if self.hp_bar_state == (pv, pv_max):
+            return
+        self.hp_bar_state = (pv, pv_max)
 
-        # Bordure
-        self.canvas.create_rectangle(
-            bar_x, bar_y,
-            bar_x + bar_width, bar_y + bar_height,
-            outline="black", width=2, fill="", tags="hp_bar"
-        )
+        table = hp_gradient_table(max(pv_max, 0))
+        bar_color = table[min(max(pv, 0), len(table) - 1)]
+        hp_ratio = pv / pv_max if pv_max else 0
 
         # Icône + texte
-        if self.enemy["pv"] > 0:
+        if pv > 0:
             icon = self.icon_hp_tk
-            text = f"{self.enemy['pv']} / {self.enemy['pv_max']}"
+            text = f"{pv} / {pv_max}"
         else:
             icon = self.icon_skull_tk
             text = "Mort"
 
-        self.canvas.create_image(
-            bar_x + 40, bar_y + bar_height / 2,
-            anchor="center", image=icon, tags="hp_bar"
-        )
-        self.canvas.create_text(
-            bar_x + bar_width / 2, bar_y + bar_height / 2,
-            anchor="center", text=text, font=("Maitree SemiBold", 12),
-            fill="black", tags="hp_bar"
-        )
+        if self.hp_fill_id is None:
+            # Remplissage, puis bordure par-dessus
+            self.hp_fill_id = self.canvas.create_rectangle(
+                bar_x, bar_y, bar_x, bar_y + bar_height,
+                outline="", width=0, tags="hp_bar"
+            )
+            self.canvas.create_rectangle(
+                bar_x, bar_y,
+                bar_x + bar_width, bar_y + bar_height,
+                outline="black", width=2, fill="", tags="hp_bar"
+            )
+            self.hp_icon_id = self.canvas.create_image(
+                bar_x + 40, bar_y + bar_height / 2,
+                anchor="center", image=icon, tags="hp_bar"
+            )
+            self.hp_text_id = self.canvas.create_text(
+                bar_x + bar_width / 2, bar_y + bar_height / 2,
+                anchor="center", text=text, font=("Maitree SemiBold", 12),
+                fill="black", tags="hp_bar"
+            )
+
+        # Remplissage si PV > 0
+        if pv > 0 and bar_color is not None:
+            self.canvas.coords(self.hp_fill_id,
+                               bar_x, bar_y,
+                               bar_x + (bar_width * hp_ratio), bar_y + bar_height)
+            self.canvas.itemconfig(self.hp_fill_id, fill=bar_color, state="normal")
+        else:
+            self.canvas.itemconfig(self.hp_fill_id, state="hidden")
+
+        self.canvas.itemconfig(self.hp_icon_id, image=icon)
+        self.canvas.itemconfig(self.hp_text_id, text=text)
+
+    # ================== SÉLECTION ==================
+    def set_selected(self, selected):
+        """Marque la carte comme sélectionnée (cadre bleu) pour les opérations par lot."""
+        self.selected = selected
+        if self.ready:
+            self.draw_selection()
+
+    def draw_selection(self):
+        self.canvas.delete("selection")
+        if self.selected:
+            self.canvas.create_rectangle(3, 3, self.width - 3, self.height - 3,
+                                         outline="#00BFFF", width=5, tags="selection")
 
     # ================== LOGIQUE PV ==================
+    @timed("card.modify_hp")
     def modify_hp(self, amount):
-        new_pv = max(0, min(self.enemy["pv"] + amount, self.enemy["pv_max"]))
-        self.enemy["pv"] = new_pv
-
-        # Met à jour la BDD
-        conn = connect_db()
-        cursor = conn.cursor()
-        cursor.execute("UPDATE ennemis_combat SET pv = ? WHERE id = ?",
-                       (new_pv, self.enemy["id"]))
-        conn.commit()
-        conn.close()
-
-        # Redessine la barre
-        self.draw_hp_bar()
+        old_pv = self.enemy["pv"]
+        new_pv = max(0, min(old_pv + amount, self.enemy["pv_max"]))
+        if new_pv == old_pv:
+            return
+        # Met à jour l'état en mémoire (écriture disque différée)
+        COMBAT_STORE.set_pv(self.enemy["id"], new_pv)
+        if self.on_hp_change is not None:
+            self.on_hp_change(self.enemy["id"], old_pv, new_pv)
 
-        # Si PV = 0 => on lance le fade + l'animation de mort
-        if new_pv == 0:
+        # Carte encore en préparation : elle sera dessinée avec les bons PV
+        if not self.ready:
+            return
+
+        self.refresh_hp()
+
+        # Si PV tombe à 0 => on lance le fade + l'animation de mort
+        if new_pv == 0 and old_pv > 0:
             self.fade_to_gray()
             self.draw_death()
+        # Soigné depuis 0 => fondu inverse, croix retirée
+        elif old_pv == 0:
+            self.revive()
+
+    def refresh_hp(self):
+        """Redessine la barre après un changement de PV (clic ou opération par lot)."""
+        if not self.ready:
+            return
+        self.draw_hp_bar()
+
+        # PV bas : frames du fondu préparées en arrière-plan ; soigné, la
+        # carte ne peut plus mourir tout de suite et les rend
+        pv = self.enemy["pv"]
+        if 0 < pv <= self.enemy["pv_max"] * FADE_PREFETCH_RATIO:
+            STATIC_LAYERS.want_fade(self.enemy, self)
+        elif pv > 0:
+            STATIC_LAYERS.drop_fade(self.enemy, self)
 
     def increment_hp(self, event):
         """Augmente les PV de l'ennemi."""
@@ -346,107 +1056,227 @@ class CarteEnnemi(tk.Frame):
         self.modify_hp(-1)
 
     # ================== ANIMATION FADE ==================
-    def fade_to_gray(self, step=0, steps=10):
+    def fade_to_gray(self, steps=FADE_STEPS):
         """
         Fait un fondu progressif (fond + ennemi) vers le gris.
+        Les frames sont partagées : chaque étape n'est qu'un itemconfig.
         """
-        if (not self.bg_color_img or not self.bg_gray_img or
-            not self.enemy_img_color or not self.enemy_img_gray):
+        if self.layer_id is None:
             return
 
-        ratio = step / float(steps)
-
-        # Blend du fond
-        bg_blended = Image.blend(self.bg_color_img, self.bg_gray_img, ratio)
-        self.bg_tk = ImageTk.PhotoImage(bg_blended)
-        self.canvas.itemconfig(self.bg_id, image=self.bg_tk)
+        STATIC_LAYERS.want_fade(self.enemy, self, steps)
+        self.fade_step = None
+        self.scheduler.start(
+            FADE_DURATION,
+            lambda progress: self.set_fade_step(round(progress * steps), steps),
+            owner=self
+        )
 
-        # Blend de l'ennemi
-        enemy_blended = Image.blend(self.enemy_img_color, self.enemy_img_gray, ratio)
-        self.enemy_img_tk = ImageTk.PhotoImage(enemy_blended)
-        self.canvas.itemconfig(self.enemy_img_id, image=self.enemy_img_tk)
+    @timed("card.set_fade_step")
+    def set_fade_step(self, step, steps=FADE_STEPS):
+        """
+        Affiche l'étape `step` du fondu (0 = couleur, steps = gris). Tant que
+        les frames se construisent en arrière-plan (mort sans passer par les
+        PV bas), l'image reste en place : le thread Tk n'attend jamais, et
+        l'animation reprend à l'étape courante dès qu'elles sont prêtes.
+        """
+        if step == self.fade_step:
+            return
+        STATIC_LAYERS.want_fade(self.enemy, self, steps)
+        if not STATIC_LAYERS.fade_ready(self.enemy, steps):
+            return
+        self.fade_step = step
 
-        if step < steps:
-            self.after(50, lambda: self.fade_to_gray(step + 1, steps))
+        self.layer_tk = STATIC_LAYERS.fade_photos(self.enemy, steps)[step]
+        self.canvas.itemconfig(self.layer_id, image=self.layer_tk)
 
     # ================== ANIMATION MORT (CROIX ROUGE) ==================
+    @timed("card.draw_death")
     def draw_death(self):
+        if self.load_death_brushes():
+            self.animate_brushes()
+
+    def load_death_brushes(self):
+        """Prépare les deux brosses de la croix rouge. Retourne False si absentes."""
         brush1_data = get_ressource_ui("red_line_right")
         brush2_data = get_ressource_ui("red_line_left")
 
         if not brush1_data or not brush2_data:
             print("❌ Ressources 'red_line_right' ou 'red_line_left' introuvables.")
-            return
+            return False
 
         brush1_path = os.path.join(RESSOURCES_DIR, brush1_data["image"])
         brush2_path = os.path.join(RESSOURCES_DIR, brush2_data["image"])
 
-        # 1) Ouvrir les images en PIL
-        brush1_pil = Image.open(brush1_path).convert("RGBA")
-        brush2_pil = Image.open(brush2_path).convert("RGBA")
+        # 1) Ouvrir les images en PIL (taille d'origine, partagées)
+        brush1_src = ASSET_CACHE.get_image(brush1_path)
+        brush2_src = ASSET_CACHE.get_image(brush2_path)
 
         # 2) Redimensionner (exemple : multiplier la taille par 1.5)
         #    ou mettre une taille fixe (ex: (300, 300))
         scale_factor = 1.5
-        new_size_1 = (int(brush1_pil.width * scale_factor), int(brush1_pil.height * scale_factor))
-        new_size_2 = (int(brush2_pil.width * scale_factor), int(brush2_pil.height * scale_factor))
-
-        brush1_pil = brush1_pil.resize(new_size_1, Image.LANCZOS)
-        brush2_pil = brush2_pil.resize(new_size_2, Image.LANCZOS)
+        new_size_1 = (int(brush1_src.width * scale_factor), int(brush1_src.height * scale_factor))
+        new_size_2 = (int(brush2_src.width * scale_factor), int(brush2_src.height * scale_factor))
 
         # 3) Stocker pour l’animation
-        self.death_brush_1 = brush1_pil
-        self.death_brush_2 = brush2_pil
+        self.death_brush_1 = (brush1_path, new_size_1)
+        self.death_brush_2 = (brush2_path, new_size_2)
+        return True
 
-        # 4) Lancer l’animation
-        self.animate_brush_1()
+    def show_dead(self):
+        """
+        Affiche directement l'état mort (gris + croix), sans animation : une
+        seule image partagée par type, ni frames de fondu ni brosses retenues.
+        """
+        self.fade_step = FADE_STEPS
+        self.layer_tk = STATIC_LAYERS.dead_photo(self.enemy)
+        self.canvas.itemconfig(self.layer_id, image=self.layer_tk)
+
+        for brush_id in (self.brush1_id, self.brush2_id):
+            if brush_id is not None:
+                self.canvas.delete(brush_id)
+        self.brush1_tk = self.brush2_tk = None
+        self.brush1_id = self.brush2_id = None
+        STATIC_LAYERS.drop_fade(self.enemy, self)
+
+    def settle_dead(self):
+        """Fin de l'animation de mort : on remplace fondu et brosses par l'état final."""
+        if self.ready and self.layer_id is not None and self.enemy["pv"] == 0:
+            self.show_dead()
+
+    # ================== RETOUR À LA VIE ==================
+    def revive(self, animate=True):
+        """
+        Annule une mort sur la carte existante (pas de reconstruction) :
+        croix effacée, puis fondu du gris vers la couleur avec les mêmes
+        frames partagées que la mort, parcourues à l'envers.
+        """
+        if not self.ready or self.layer_id is None:
+            return
+        self.cancel_animations()
+        for brush_id in (self.brush1_id, self.brush2_id):
+            if brush_id is not None:
+                self.canvas.delete(brush_id)
+        self.brush1_tk = self.brush2_tk = None
+        self.brush1_id = self.brush2_id = None
+
+        if not animate:
+            self.settle_alive()
+            return
+
+        STATIC_LAYERS.want_fade(self.enemy, self)
+        self.fade_step = None
+        self.scheduler.start(
+            FADE_DURATION,
+            lambda progress: self.set_fade_step(round((1 - progress) * FADE_STEPS)),
+            on_done=self.settle_alive,
+            owner=self
+        )
 
-    def animate_brush_1(self, step=0, max_steps=10):
-        """Fait glisser la brosse 1 en diagonale bas-gauche -> haut-droit."""
-        if step == 0:
-            self.brush1_tk = ImageTk.PhotoImage(self.death_brush_1)
+    def settle_alive(self):
+        """Fin du fondu inverse : couche statique en couleur, frames rendues."""
+        if self.ready and self.layer_id is not None and self.enemy["pv"] > 0:
+            self.fade_step = None
+            self.layer_tk = STATIC_LAYERS.photo(self.enemy)
+            self.canvas.itemconfig(self.layer_id, image=self.layer_tk)
+            STATIC_LAYERS.drop_fade(self.enemy, self)
+            self.refresh_hp()
+
+    def create_brush(self, number):
+        """Crée la brosse 1 ou 2 hors de la carte et retourne son ID canvas."""
+        if number == 1:
+            self.brush1_tk = ASSET_CACHE.get_photo(*self.death_brush_1)
             self.brush1_id = self.canvas.create_image(-9999, -9999,
                                                       image=self.brush1_tk,
                                                       anchor="center")
+            return self.brush1_id
+
+        self.brush2_tk = ASSET_CACHE.get_photo(*self.death_brush_2)
+        self.brush2_id = self.canvas.create_image(-9999, -9999,
+                                                  image=self.brush2_tk,
+                                                  anchor="center")
+        return self.brush2_id
+
+    def brush_start(self, number):
+        """Départ de la brosse 1 (bas-gauche) ou 2 (haut-gauche)."""
+        return (-50, self.height + 50) if number == 1 else (-50, -50)
+
+    def animate_brushes(self):
+        """Fait glisser la brosse 1, puis la brosse 2, jusqu'au centre de la carte."""
+        brush_id = self.create_brush(1)
+
+        # Brosse 1 : diagonale bas-gauche -> haut-droit
+        self.scheduler.start(
+            BRUSH_DURATION,
+            lambda frac: self.move_brush(brush_id, self.brush_start(1), frac),
+            on_done=self.animate_brush_2,
+            owner=self
+        )
 
-        # Coordonnées de départ (bas gauche, en dehors du Canvas si tu veux)
-        x_start, y_start = -50, self.height + 50
+    def animate_brush_2(self):
+        """Fait glisser la brosse 2 en diagonale haut-gauche -> bas-droit."""
+        brush_id = self.create_brush(2)
 
+        self.scheduler.start(
+            BRUSH_DURATION,
+            lambda frac: self.move_brush(brush_id, self.brush_start(2), frac),
+            on_done=self.settle_dead,
+            owner=self
+        )
+
+    @timed("card.move_brush")
+    def move_brush(self, brush_id, start, frac):
+        """Place une brosse à la fraction `frac` du trajet départ -> centre."""
+        x_start, y_start = start
         # Coordonnées d'arrivée = centre de la carte
         x_end, y_end = self.width * 0.5, self.height * 0.5
 
-
-        frac = step / float(max_steps)
         x = x_start + (x_end - x_start) * frac
         y = y_start + (y_end - y_start) * frac
 
-        self.canvas.coords(self.brush1_id, x, y)
+        self.canvas.coords(brush_id, x, y)
 
-        if step < max_steps:
-            self.after(50, lambda: self.animate_brush_1(step + 1, max_steps))
-        else:
-            self.animate_brush_2()
 
-    def animate_brush_2(self, step=0, max_steps=10):
-        """Fait glisser la brosse 2 en diagonale haut-gauche -> bas-droit."""
-        if step == 0:
-            self.brush2_tk = ImageTk.PhotoImage(self.death_brush_2)
-            self.brush2_id = self.canvas.create_image(-9999, -9999,
-                                                      image=self.brush2_tk,
-                                                      anchor="center")
-
-        x_start, y_start = -50, -50  # par exemple, en dehors en haut gauche
-        x_end, y_end = self.width * 0.5, self.height * 0.5
-
-
-        frac = step / float(max_steps)
-        x = x_start + (x_end - x_start) * frac
-        y = y_start + (y_end - y_start) * frac
-
-        self.canvas.coords(self.brush2_id, x, y)
-
-        if step < max_steps:
-            self.after(50, lambda: self.animate_brush_2(step + 1, max_steps))
-        else:
-            # Animation terminée
-            pass
+# ================== MORTS GROUPÉES ==================
+def animate_deaths(cards, scheduler):
+    """
+    Fondu et croix rouge de toutes les cartes tuées par un même lot : une
+    seule animation du planificateur par phase, quel que soit le nombre de
+    cartes. Une carte recyclée entre-temps est ignorée.
+    """
+    bound = [(carte, carte.enemy["id"]) for carte in cards
+             if carte.ready and carte.layer_id is not None and carte.load_death_brushes()]
+    if not bound:
+        return
+
+    def live_cards():
+        # Carte recyclée, ou ennemi ramené à la vie (annulation) pendant l'animation
+        return [carte for carte, enemy_id in bound
+                if carte.winfo_exists() and carte.ready and carte.enemy["id"] == enemy_id
+                and carte.enemy["pv"] == 0]
+
+    def fade(progress):
+        for carte in live_cards():
+            carte.set_fade_step(round(progress * FADE_STEPS))
+
+    def brushes(number, on_done=None):
+        moving = [(carte, carte.create_brush(number)) for carte in live_cards()]
+
+        def move(frac):
+            # Une carte peut être détruite ou recyclée pendant l'animation
+            live = set(map(id, live_cards()))
+            for carte, brush_id in moving:
+                if id(carte) in live:
+                    carte.move_brush(brush_id, carte.brush_start(number), frac)
+
+        scheduler.start(BRUSH_DURATION, move, on_done=on_done)
+
+    def settle():
+        for carte in live_cards():
+            carte.settle_dead()
+
+    for carte, _ in bound:
+        STATIC_LAYERS.want_fade(carte.enemy, carte)
+        carte.fade_step = None
+    scheduler.start(FADE_DURATION, fade)
+    brushes(1, on_done=lambda: brushes(2, on_done=settle))
@@ -0,0 +1,169 @@
+"""
+Gestionnaire de connexions SQLite.
+
+Une seule connexion configurée par thread, réutilisée par tous les appels.
+Les migrations du schéma ne sont appliquées qu'une fois, à la première ouverture.
+"""
+import sqlite3
+import os
+import threading
+import atexit
+from migrations import migrate
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.path.join(BASE_DIR, "ennemy_mod.db")
+
+# Base de la session de combat, attachée sous le nom `session` : le
+# catalogue n'est jamais réécrit et finir une session revient à la supprimer
+SESSION_DB_PATH = os.path.join(BASE_DIR, "combat_session.db")
+
+# Taille du cache de requêtes préparées (défaut sqlite3 : 128)
+CACHED_STATEMENTS = 512
+
+# PRAGMA appliqués à chaque nouvelle connexion
+PRAGMAS = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),  # En WAL : pas de fsync à chaque commit
+    ("cache_size", -16000),     # ~16 Mo de cache de pages
+    ("temp_store", "MEMORY"),
+)
+
+SESSION_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS session.ennemis_combat (
+        id INTEGER PRIMARY KEY,
+        ennemi_source_id INTEGER,
+        nom TEXT,
+        numero INTEGER,
+        mouvement INTEGER,
+        attaque INTEGER,
+        pv INTEGER,
+        pv_max INTEGER,
+        elite INTEGER,
+        image TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS session.idx_ennemis_combat_source ON ennemis_combat(ennemi_source_id)",
+    # Journal des actions (annuler/rétablir compris), en ajout seul
+    """
+    CREATE TABLE IF NOT EXISTS session.journal_actions (
+        id INTEGER PRIMARY KEY,
+        horodatage REAL,
+        action TEXT,
+        type TEXT,
+        donnees TEXT
+    )
+    """,
+)
+
+_local = threading.local()
+_lock = threading.Lock()
+_connections = []
+_schema_ready = False
+
+
+def _open_connection():
+    """Ouvre une connexion et lui applique les PRAGMA."""
+    conn = sqlite3.connect(DB_PATH, cached_statements=CACHED_STATEMENTS,
+                           check_same_thread=False)
+    for name, value in PRAGMAS:
+        conn.execute(f"PRAGMA {name} = {value}")
+    return conn
+
+
+def _attach_session(conn):
+    """Attache la base de session et crée ses tables si besoin."""
+    conn.execute("ATTACH DATABASE ? AS session", (SESSION_DB_PATH,))
+    conn.execute("PRAGMA session.journal_mode = WAL")
+    with conn:
+        for ddl in SESSION_SCHEMA:
+            conn.execute(ddl)
+
+
+def init_schema(conn):
+    """Met le schéma à jour (migrations). N'a d'effet qu'une fois par processus."""
+    global _schema_ready
+    with _lock:
+        if _schema_ready:
+            return
+        migrate(conn)
+        _schema_ready = True
+
+
+def get_connection():
+    """Retourne la connexion du thread courant (ouverte au premier appel)."""
+    conn = getattr(_local, "conn", None)
+    if conn is None or conn not in _connections:
+        conn = _open_connection()
+        init_schema(conn)
+        _attach_session(conn)
+        _local.conn = conn
+        with _lock:
+            _connections.append(conn)
+    return conn
+
+
+def close_connection():
+    """Ferme la connexion du thread courant."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        return
+    _local.conn = None
+    with _lock:
+        if conn in _connections:
+            _connections.remove(conn)
+    conn.close()
+
+
+def checkpoint():
+    """
+    Reporte le WAL dans le fichier catalogue et le vide : `ennemy_mod.db`
+    est alors complet à lui seul (copie, commit). À appeler avant toute copie.
+    """
+    get_connection().execute("PRAGMA main.wal_checkpoint(TRUNCATE)")
+
+
+def close_all():
+    """Ferme toutes les connexions ouvertes (appelé à la sortie)."""
+    with _lock:
+        connections = list(_connections)
+        _connections.clear()
+    for conn in connections:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
+# ================== SESSION DE COMBAT ==================
+def reset_session():
+    """Démarre une session vide : DROP de la table de combat, sans toucher au catalogue."""
+    conn = get_connection()
+    with conn:
+        conn.execute("DROP TABLE IF EXISTS session.ennemis_combat")
+        conn.execute("DROP TABLE IF EXISTS session.journal_actions")
+        for ddl in SESSION_SCHEMA:
+            conn.execute(ddl)
+
+
+def end_session():
+    """Ferme les connexions et supprime le fichier de session."""
+    close_all()
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.remove(SESSION_DB_PATH + suffix)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"⚠️ Fichier de session non supprimé ({SESSION_DB_PATH + suffix}) : {e}")
+
+
+def compact_catalog():
+    """Compacte le fichier catalogue (VACUUM). Uniquement sur demande explicite."""
+    conn = get_connection()
+    conn.execute("VACUUM main")
+    print("✅ Base catalogue compactée.")
+
+
+atexit.register(close_all)
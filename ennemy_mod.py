@@ -1,92 +1,224 @@
+from instrumentation import ENABLED as PROFILING, PROFILER, STARTUP, STARTUP_PROFILE
 import tkinter as tk
 from tkinter import ttk
-from ttkbootstrap import Style
-from database import get_enemy_data, connect_db
-from custom_card import CarteEnnemi
-import sqlite3
+from database import get_enemy_data
+from db_manager import reset_session, end_session, compact_catalog
+from animation import AnimationScheduler
+from combat_state import COMBAT_STORE
+from catalogue import CATALOGUE
+from snapshot import save_snapshot, load_snapshot
+from historique import HistoriqueCombat, ChangementPV, Apparition, Retrait
+import sys
 import atexit
 
+# Imports lourds différés (ttkbootstrap, PIL via custom_card/battlefield) :
+# la fenêtre s'affiche d'abord, l'interface est construite juste après
+
 # Définition des dimensions
 WINDOW_WIDTH = 1600
 WINDOW_HEIGHT = 800
-CARD_SPACING = 20  # Espacement entre les cartes
-MAX_COLUMNS = 3  # Nombre max de cartes par ligne avant passage à la suivante
 
-def connect_db():
-    """Connexion à la base de données"""
-    return sqlite3.connect("ennemy_mod.db")
+# Overlays de diagnostic (F12 : profilage, F11 : mémoire)
+PROFILE_OVERLAY_LINES = 15
+MEMORY_OVERLAY_CARDS = 10
+OVERLAY_REFRESH_MS = 500
 
 def clear_table():
-    """Vide la table 'ennemis_combat' et réinitialise l'auto-incrémentation."""
-    conn = connect_db()
-    cursor = conn.cursor()
-    try:
-        cursor.execute("DELETE FROM ennemis_combat;")
-        conn.commit()
-        cursor.execute("DELETE FROM sqlite_sequence WHERE name='ennemis_combat';")
-        conn.commit()
-        cursor.execute("VACUUM;")
-        conn.commit()
-        print("✅ Table 'ennemis_combat' vidée et ID réinitialisé à 1.")
-    except sqlite3.OperationalError as e:
-        print(f"❌ Erreur lors du nettoyage : {e}")
-    finally:
-        cursor.close()
-        conn.close()
+    """Termine la session de combat : simple suppression de la base de session (pas de VACUUM)."""
+    # Écrit ce qui reste en attente et arrête le thread d'écriture
+    COMBAT_STORE.stop()
+    COMBAT_STORE.clear()
+    end_session()
+    print("✅ Session de combat terminée.")
 
 atexit.register(clear_table)
 
+def combat_row(enemy_data):
+    """Ligne `ennemis_combat` pour un ennemi du catalogue."""
+    return {
+        "ennemi_source_id": enemy_data["id"],
+        "nom": enemy_data["nom"],
+        "mouvement": enemy_data["mouvement"],
+        "attaque": enemy_data["attaque"],
+        "pv": enemy_data["pv"],
+        "pv_max": enemy_data["pv_max"],
+        "elite": enemy_data["elite"],
+        "image": enemy_data["image"],
+    }
+
 class JeuGUI:
-    def __init__(self, root):
+    def __init__(self, root, restore=False, replay=False):
         self.root = root
         self.root.title("Gestion des Ennemis - Gloomhaven")
         self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.root.configure(bg="#2C2F33")
+        self.restore = restore
+        self.replay = replay
+        self.journal = []
+        self.battlefield = None
+        self.historique = HistoriqueCombat(self)
+
+        # Fenêtre visible tout de suite ; le reste est construit dans demarrer()
+        self.ecran_chargement = tk.Label(self.root, text="Chargement…", bg="#2C2F33",
+                                         fg="#b0b0b0", font=("Maitree SemiBold", 16))
+        self.ecran_chargement.place(relx=0.5, rely=0.5, anchor="center")
+        self.root.protocol("WM_DELETE_WINDOW", self.fermer)
+        # Un minuteur Tcl passerait avant le mappage et le dessin de la
+        # fenêtre : on les force d'abord, puis on démarre au premier repos
+        self.root.update()
+        self.root.after_idle(self.demarrer)
+
+    def demarrer(self):
+        """Phases lourdes du démarrage, une fois la fenêtre affichée."""
+        with STARTUP.phase("thème ttkbootstrap"):
+            from ttkbootstrap import Style
+            self.style = Style("darkly")
+
+        with STARTUP.phase("session de combat"):
+            # Journal d'une session interrompue, lu avant de repartir à vide
+            if self.replay:
+                self.journal = COMBAT_STORE.load_journal()
+            reset_session()
+            COMBAT_STORE.load()
+            COMBAT_STORE.start()
+            self.animations = AnimationScheduler(self.root)
+
+        with STARTUP.phase("interface"):
+            self.setup_ui()
+            self.ecran_chargement.destroy()
+
+        # Catalogue au premier moment libre : l'interface est déjà utilisable
+        self.root.after_idle(self.terminer_demarrage)
+
+    def terminer_demarrage(self):
+        with STARTUP.phase("catalogue"):
+            self.charger_liste_ennemis()
+
+        if self.journal:
+            with STARTUP.phase("rejeu du journal"):
+                count = self.historique.rejouer(self.journal)
+                print(f"✅ {count} actions rejouées ({len(self.battlefield.order)} ennemis).")
+        elif self.restore:
+            with STARTUP.phase("restauration du combat"):
+                self.restaurer_combat()
 
-        self.ennemis_combat = {}
-        self.style = Style("darkly")
-        self.setup_ui()
-        self.charger_liste_ennemis()
+        if STARTUP_PROFILE:
+            self.root.update_idletasks()
+            STARTUP.mark("premier rendu complet")
+            print("\n".join(STARTUP.report()))
 
     def setup_ui(self):
         """Création de l'interface graphique avec une scrollbar."""
         self.frame_gauche = ttk.Frame(self.root, padding=10)
         self.frame_gauche.pack(side=tk.LEFT, fill=tk.Y, padx=10, pady=10)
 
-        self.liste_ennemis = ttk.Combobox(self.frame_gauche, state="readonly")
+        # Sélecteur avec filtrage incrémental (préfixe puis sous-chaîne)
+        self.liste_ennemis = ttk.Combobox(self.frame_gauche)
         self.liste_ennemis.pack(pady=5)
+        self.liste_ennemis.bind("<KeyRelease>", self.filtrer_ennemis)
+        self.liste_ennemis.bind("<Return>", lambda e: self.ajouter_ennemi())
 
         self.bouton_ajouter = ttk.Button(self.frame_gauche, text="Ajouter l'ennemi", bootstyle="primary", command=self.ajouter_ennemi)
         self.bouton_ajouter.pack(pady=10)
 
+        # Ajout d'un groupe complet (ex : 4 normaux + 2 élites)
+        self.frame_groupe = ttk.Frame(self.frame_gauche)
+        self.frame_groupe.pack(pady=5)
+        ttk.Label(self.frame_groupe, text="Normaux").grid(row=0, column=0, padx=2)
+        self.nb_normaux = ttk.Spinbox(self.frame_groupe, from_=0, to=20, width=4)
+        self.nb_normaux.set(0)
+        self.nb_normaux.grid(row=0, column=1, padx=2)
+        ttk.Label(self.frame_groupe, text="Élites").grid(row=0, column=2, padx=2)
+        self.nb_elites = ttk.Spinbox(self.frame_groupe, from_=0, to=20, width=4)
+        self.nb_elites.set(0)
+        self.nb_elites.grid(row=0, column=3, padx=2)
+
+        self.bouton_ajouter_groupe = ttk.Button(self.frame_gauche, text="Ajouter le groupe", bootstyle="primary", command=self.ajouter_groupe)
+        self.bouton_ajouter_groupe.pack(pady=10)
+
+        self.bouton_retirer_morts = ttk.Button(self.frame_gauche, text="Retirer les morts", bootstyle="secondary", command=self.retirer_morts)
+        self.bouton_retirer_morts.pack(pady=10)
+
+        # Annuler / rétablir (Ctrl+Z / Ctrl+Y)
+        self.frame_historique = ttk.Frame(self.frame_gauche)
+        self.frame_historique.pack(pady=5)
+        ttk.Button(self.frame_historique, text="Annuler", bootstyle="secondary",
+                   command=self.annuler).grid(row=0, column=0, padx=2)
+        ttk.Button(self.frame_historique, text="Rétablir", bootstyle="secondary",
+                   command=self.retablir).grid(row=0, column=1, padx=2)
+        self.root.bind_all("<Control-z>", lambda e: self.annuler())
+        self.root.bind_all("<Control-y>", lambda e: self.retablir())
+
+        # Opérations PV par lot : sélection (Ctrl+clic ou mode sélection), élites, tous
+        self.frame_lot = ttk.Labelframe(self.frame_gauche, text="PV par lot", padding=5)
+        self.frame_lot.pack(pady=(20, 5), fill=tk.X)
+        self.mode_selection = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.frame_lot, text="Mode sélection", variable=self.mode_selection,
+                        command=self.basculer_mode_selection).pack(anchor="w", pady=2)
+        frame_montant = ttk.Frame(self.frame_lot)
+        frame_montant.pack(pady=2)
+        ttk.Label(frame_montant, text="PV (+/-)").pack(side=tk.LEFT, padx=2)
+        self.montant_lot = ttk.Spinbox(frame_montant, from_=-20, to=20, width=4)
+        self.montant_lot.set(-1)
+        self.montant_lot.pack(side=tk.LEFT, padx=2)
+        for texte, cible in (("À la sélection", "selection"), ("Aux élites", "elites"), ("À tous", "tous")):
+            ttk.Button(self.frame_lot, text=texte, bootstyle="warning",
+                       command=lambda c=cible: self.appliquer_pv_lot(c)).pack(fill=tk.X, pady=2)
+        ttk.Button(self.frame_lot, text="Vider la sélection", bootstyle="secondary",
+                   command=lambda: self.battlefield.clear_selection()).pack(fill=tk.X, pady=2)
+
+        self.bouton_sauvegarder = ttk.Button(self.frame_gauche, text="Sauvegarder le combat", bootstyle="info", command=self.sauvegarder_combat)
+        self.bouton_sauvegarder.pack(pady=(30, 5))
+
+        self.bouton_restaurer = ttk.Button(self.frame_gauche, text="Restaurer le combat", bootstyle="info", command=self.restaurer_combat)
+        self.bouton_restaurer.pack(pady=5)
+
         self.battlefield_frame = ttk.Frame(self.root, padding=10)
         self.battlefield_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=20, pady=20)
 
-        self.canvas = tk.Canvas(self.battlefield_frame, bg="#2C2F33")
-        self.scrollbar = ttk.Scrollbar(self.battlefield_frame, orient="vertical", command=self.canvas.yview)
-        self.scrollable_frame = ttk.Frame(self.canvas, padding=10)
-        
-        self.scrollable_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
+        from battlefield import Battlefield
+        self.canvas = tk.Canvas(self.battlefield_frame, bg="#2C2F33", highlightthickness=0)
+        self.battlefield = Battlefield(self.canvas, scheduler=self.animations,
+                                       on_hp_change=self.pv_modifie)
+        self.scrollbar = ttk.Scrollbar(self.battlefield_frame, orient="vertical", command=self.battlefield.yview)
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
 
+        self.root.bind_all("<MouseWheel>", self.battlefield.on_mousewheel)
+        self.root.bind_all("<Button-4>", self.battlefield.on_mousewheel)
+        self.root.bind_all("<Button-5>", self.battlefield.on_mousewheel)
+
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
+        # Overlays de diagnostic : profilage (F12), mémoire des images (F11)
+        self.overlays = {}
+        self.root.bind("<F12>", lambda e: self.basculer_overlay("profilage", self.lignes_profilage, "ne"))
+        self.root.bind("<F11>", lambda e: self.basculer_overlay("memoire", self.lignes_memoire, "se"))
+
     def charger_liste_ennemis(self):
-        """Charge la liste des ennemis."""
-        conn = connect_db()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("SELECT nom FROM ennemis ORDER BY nom ASC")
-            self.liste_ennemis["values"] = [nom[0] for nom in cursor.fetchall()]
-        finally:
-            cursor.close()
-            conn.close()
+        """Charge le catalogue en mémoire et remplit la liste des ennemis."""
+        CATALOGUE.load()
+        self.liste_ennemis["values"] = CATALOGUE.names()
+
+    def filtrer_ennemis(self, event):
+        """Filtre la liste au fil de la frappe, sans requête en base."""
+        if event.keysym in ("Return", "Up", "Down", "Escape"):
+            return
+        self.liste_ennemis["values"] = CATALOGUE.search(self.liste_ennemis.get())
+
+    def selection_ennemi(self):
+        """Nom exact du catalogue correspondant à la saisie (ou None)."""
+        saisie = self.liste_ennemis.get()
+        if not saisie:
+            return None
+        if CATALOGUE.get(saisie):
+            return saisie
+        resultats = CATALOGUE.search(saisie, limit=1)
+        return resultats[0] if resultats else None
 
     def ajouter_ennemi(self):
         """Ajoute un ennemi dans la table `ennemis_combat` et l'affiche sur le champ de bataille."""
-        selection = self.liste_ennemis.get()
+        selection = self.selection_ennemi()
         if not selection:
             print("❌ Aucun ennemi sélectionné")
             return
@@ -95,28 +227,278 @@ class JeuGUI:
         if not enemy_data:
             return
 
-        conn = connect_db()
-        cursor = conn.cursor()
+        enemy_id = COMBAT_STORE.add(combat_row(enemy_data))
+        print(f"✅ Ennemi ajouté avec ID: {enemy_id}")
+
+        self.battlefield.add(enemy_id)
+        self.historique.record(Apparition([COMBAT_STORE.get(enemy_id)]))
+
+    def ajouter_groupe(self):
+        """Ajoute N normaux + M élites du monstre sélectionné en une seule opération."""
+        selection = self.selection_ennemi()
+        if not selection:
+            print("❌ Aucun ennemi sélectionné")
+            return
+
+        try:
+            nb_normaux, nb_elites = int(self.nb_normaux.get()), int(self.nb_elites.get())
+        except ValueError:
+            print("❌ Nombre d'ennemis invalide")
+            return
+
+        nom_base = selection.replace(" ELITE", "")
+        self.spawn_group(nom_base, nb_normaux, nb_elites)
+
+    def spawn_group(self, nom_base, nb_normaux, nb_elites):
+        """
+        Insère tout le groupe en une transaction, prépare les cartes en lot
+        et ne met le champ de bataille en page qu'une fois. Retourne les IDs.
+        """
+        rows = []
+        for nom, nombre in ((nom_base, nb_normaux), (f"{nom_base} ELITE", nb_elites)):
+            if nombre <= 0:
+                continue
+            enemy_data = get_enemy_data(nom)
+            if not enemy_data:
+                continue
+            rows.extend(combat_row(enemy_data) for _ in range(nombre))
+
+        if not rows:
+            return []
+
+        from custom_card import prepare_cards
+        prepare_cards(rows)
+        enemy_ids = COMBAT_STORE.add_many(rows)
+        self.battlefield.add_many(enemy_ids)
+        self.historique.record(Apparition([COMBAT_STORE.get(i) for i in enemy_ids]))
+        print(f"✅ {len(enemy_ids)} ennemis ajoutés : {nom_base} ({nb_normaux} normaux, {nb_elites} élites)")
+        return enemy_ids
+
+    def basculer_overlay(self, nom, lignes, anchor):
+        """Affiche ou masque un overlay de diagnostic (rafraîchi tant qu'il est visible)."""
+        if nom in self.overlays:
+            label, after_id = self.overlays.pop(nom)
+            if after_id is not None:
+                self.root.after_cancel(after_id)
+            label.destroy()
+            return
+
+        label = tk.Label(self.root, justify=tk.LEFT, anchor="nw",
+                         font=("Courier", 9), bg="#111111", fg="#9fe870",
+                         padx=8, pady=6)
+        en_bas = anchor.startswith("s")
+        label.place(relx=1.0, rely=1.0 if en_bas else 0.0,
+                    x=-10, y=-10 if en_bas else 10, anchor=anchor)
+        self.overlays[nom] = (label, None)
+        self.rafraichir_overlay(nom, lignes)
+
+    def rafraichir_overlay(self, nom, lignes):
+        if nom not in self.overlays:
+            return
+        label, _ = self.overlays[nom]
+        label.configure(text="\n".join(lignes()))
+        self.overlays[nom] = (label, self.root.after(OVERLAY_REFRESH_MS,
+                                                     self.rafraichir_overlay, nom, lignes))
+
+    def lignes_profilage(self):
+        """Statistiques de profilage (F12)."""
+        if PROFILING:
+            lignes = PROFILER.report(limit=PROFILE_OVERLAY_LINES) or ["(aucune mesure)"]
+        else:
+            lignes = ["Instrumentation désactivée (GLOOMHAVEN_PROFILE=1 ou --profile)"]
+        anim = self.animations.stats()
+        lignes.append(f"animations {anim['active']}  frames {anim['frames']}  "
+                      f"sautées {anim['skipped_frames']}  frame moy {anim['frame_ms_avg']:.2f} ms")
+        return lignes
+
+    def lignes_memoire(self):
+        """Mémoire des images, au total et par carte affichée (F11)."""
+        def mo(octets):
+            return f"{octets / (1024 * 1024):6.1f} Mo"
+
+        from custom_card import image_memory, STATIC_LAYERS
+
+        usage = image_memory()
+        couches = STATIC_LAYERS.stats()
+        lignes = [
+            f"images           {mo(usage['total'])} / {mo(usage['budget'])}",
+            f"  assets         {mo(usage['assets'])}",
+            f"  fondu sources  {mo(usage['fade_sources'])}",
+            f"  couches        {mo(usage['static_layers'])}  "
+            f"({couches['types']} types, {couches['fading_types']} en fondu)",
+        ]
+        cartes = sorted(((carte.image_bytes(), enemy_id)
+                         for enemy_id, (carte, _) in self.battlefield.visible.items()),
+                        reverse=True)
+        lignes.append(f"cartes affichées {len(cartes)}, au repos {len(self.battlefield.pool)} "
+                      f"(images partagées par type)")
+        lignes.extend(f"  #{enemy_id:<5} {mo(octets)}" for octets, enemy_id in cartes[:MEMORY_OVERLAY_CARDS])
+        return lignes
+
+    def basculer_mode_selection(self):
+        self.battlefield.select_mode = self.mode_selection.get()
+
+    def cibles_lot(self, cible):
+        """IDs visés par une opération par lot (ennemis vivants uniquement)."""
+        if cible == "selection":
+            ids = self.battlefield.selected_ids()
+        elif cible == "elites":
+            ids = [i for i in self.battlefield.order if COMBAT_STORE.get(i)["elite"]]
+        else:
+            ids = list(self.battlefield.order)
+        return [i for i in ids if COMBAT_STORE.get(i)["pv"] > 0]
+
+    def appliquer_pv_lot(self, cible):
+        """
+        Applique le même changement de PV à plusieurs ennemis : une seule
+        transaction, un seul redessin par carte, une seule passe de mort.
+        """
         try:
-            cursor.execute("""
-                INSERT INTO ennemis_combat (nom, mouvement, attaque, pv, pv_max, elite, image)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (selection, enemy_data["mouvement"], enemy_data["attaque"], enemy_data["pv"], enemy_data["pv_max"], enemy_data["elite"], enemy_data["image"]))
-            conn.commit()
+            montant = int(self.montant_lot.get())
+        except ValueError:
+            print("❌ Montant de PV invalide")
+            return
+
+        changes = {}
+        for enemy_id in self.cibles_lot(cible):
+            enemy = COMBAT_STORE.get(enemy_id)
+            new_pv = max(0, min(enemy["pv"] + montant, enemy["pv_max"]))
+            if new_pv != enemy["pv"]:
+                changes[enemy_id] = (enemy["pv"], new_pv)
+        if not changes:
+            return
+
+        self.historique.execute(ChangementPV(changes))
+        morts = sum(1 for _, new_pv in changes.values() if new_pv == 0)
+        print(f"✅ {montant:+d} PV appliqués à {len(changes)} ennemis ({morts} morts)")
 
-            enemy_id = cursor.lastrowid  
-            print(f"✅ Ennemi ajouté avec ID: {enemy_id}")
+    # ================== ANNULER / RÉTABLIR ==================
+    def annuler(self):
+        if self.historique.undo() is None:
+            print("⚠️ Rien à annuler.")
 
-            carte = CarteEnnemi(self.scrollable_frame, enemy_id)
-            row = len(self.ennemis_combat) // MAX_COLUMNS
-            col = len(self.ennemis_combat) % MAX_COLUMNS
-            carte.grid(row=row, column=col, padx=10, pady=10)
+    def retablir(self):
+        if self.historique.redo() is None:
+            print("⚠️ Rien à rétablir.")
 
-            self.ennemis_combat[enemy_id] = carte
+    def pv_modifie(self, enemy_id, old_pv, new_pv):
+        """Clic - / + sur une carte : déjà appliqué, seulement empilé."""
+        self.historique.record(ChangementPV({enemy_id: (old_pv, new_pv)}))
+
+    def appliquer_pv(self, pv_par_id):
+        """
+        Fixe les PV de plusieurs ennemis (commandes d'historique) : une seule
+        transaction, un seul redessin par carte, une seule passe de mort, et
+        fondu inverse pour les ennemis ramenés à la vie.
+        """
+        anciens = {enemy_id: COMBAT_STORE.get(enemy_id)["pv"]
+                   for enemy_id in pv_par_id if COMBAT_STORE.get(enemy_id) is not None}
+        COMBAT_STORE.set_pv_many({i: pv_par_id[i] for i in anciens})
+
+        # Seules les cartes matérialisées sont redessinées ; les autres le
+        # seront avec les bons PV en revenant dans la vue
+        morts = []
+        for enemy_id, old_pv in anciens.items():
+            carte = self.battlefield.card(enemy_id)
+            if carte is None:
+                continue
+            carte.refresh_hp()
+            if pv_par_id[enemy_id] == 0 and old_pv > 0:
+                morts.append(carte)
+            elif old_pv == 0 and pv_par_id[enemy_id] > 0:
+                carte.revive()
+        from custom_card import animate_deaths
+        animate_deaths(morts, self.animations)
+
+    def inserer_lignes(self, rows, positions=None):
+        """Remet des lignes complètes (IDs conservés) en fin de grille ou à leurs indices."""
+        from custom_card import prepare_cards
+        prepare_cards(rows)
+        COMBAT_STORE.add_rows(rows)
+        enemy_ids = [row["id"] for row in rows]
+        if positions is None:
+            self.battlefield.add_many(enemy_ids)
+        else:
+            self.battlefield.insert_many(enemy_ids, positions)
+
+    def retirer_lignes(self, enemy_ids):
+        self.battlefield.remove_many(enemy_ids)
+        COMBAT_STORE.remove_many(enemy_ids)
+
+    def sauvegarder_combat(self):
+        """Sauvegarde le combat en cours (lignes, PV, ordre de la grille)."""
+        save_snapshot(COMBAT_STORE, self.battlefield.order)
+
+    def restaurer_combat(self):
+        """
+        Reconstruit tout le champ de bataille depuis l'instantané, en une passe :
+        images préparées en lot, cartes mortes affichées sans animation.
+        """
+        rows = load_snapshot()
+        if not rows:
+            return
+
+        enemy_ids = self.remplacer_lignes(rows)
+        self.historique.reset(rows)
+        print(f"✅ Combat restauré ({len(enemy_ids)} ennemis).")
+
+    def remplacer_lignes(self, rows):
+        """Remplace tout le combat par ces lignes (restauration ou rejeu)."""
+        self.battlefield.clear()
+        from custom_card import prepare_cards
+        prepare_cards(rows)
+        enemy_ids = COMBAT_STORE.restore(rows)
+        self.battlefield.add_many(enemy_ids)
+        return enemy_ids
+
+    def fermer(self):
+        """
+        Sauvegarde automatique du combat avant de quitter, même vide (un
+        combat terminé ne doit pas revenir avec --restore), mais seulement si
+        la session l'a restauré ou modifié : sinon l'instantané reste intact.
+        La fenêtre se ferme même si l'écriture échoue.
+        """
+        try:
+            if self.battlefield is not None and self.historique.entrees:
+                self.sauvegarder_combat()
+        except OSError as e:
+            print(f"❌ Sauvegarde automatique impossible : {e}")
         finally:
-            cursor.close()
-            conn.close()
+            self.root.destroy()
+
+    def retirer_morts(self):
+        """
+        Retire les ennemis morts du champ de bataille en un seul lot : une
+        mise en page, une transaction (leurs cartes sont recyclées).
+        """
+        morts = [(index, enemy_id) for index, enemy_id in enumerate(self.battlefield.order)
+                 if COMBAT_STORE.get(enemy_id) is not None and COMBAT_STORE.get(enemy_id)["pv"] == 0]
+        if not morts:
+            return
+        # Indices gardés : l'annulation remet chaque carte à sa place
+        self.historique.execute(Retrait([COMBAT_STORE.get(enemy_id) for _, enemy_id in morts],
+                                        [index for index, _ in morts]))
+
+def main(argv=None):
+    """
+    Options : --compact (VACUUM du catalogue), --restore (reprise du combat
+    sauvegardé), --replay (rejeu du journal d'une session interrompue),
+    --startup-profile (durée de chaque phase du démarrage),
+    --profile (instrumentation, voir instrumentation.py).
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    STARTUP.mark("imports")
+
+    # Compactage du catalogue uniquement sur demande
+    if "--compact" in argv:
+        with STARTUP.phase("compactage"):
+            compact_catalog()
+
+    with STARTUP.phase("fenêtre"):
+        root = tk.Tk()
+        JeuGUI(root, restore="--restore" in argv, replay="--replay" in argv)
+    root.mainloop()
+
 
-root = tk.Tk()
-app = JeuGUI(root)
-root.mainloop()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""
+Rendu des cartes sans affichage (PIL uniquement) et export en lot.
+
+`compose_static_layer` assemble la partie fixe d'une carte (fond, titre,
+stats, portrait) : c'est l'image partagée affichée par CarteEnnemi.
+`render_card` y ajoute l'identifiant, la barre de vie et la croix rouge
+pour obtenir la carte complète. En ligne de commande, le catalogue entier ou les monstres d'un
+scénario sont rendus en PNG sur un pool de processus, avec des planches
+imprimables en option :
+
+    python headless_render.py --catalogue --out export --planches
+    python headless_render.py --scenario "Pillard Vermling" "Garde Vermling" --out export
+"""
+import argparse
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from PIL import Image, ImageDraw, ImageFont
+from custom_card import (
+    ASSET_CACHE, CARD_WIDTH, CARD_HEIGHT, RESSOURCES_DIR,
+    BG_SIZE, ENEMY_SIZE, STAT_ICON_SIZE, HP_ICON_SIZE, FADE_STEPS,
+    ICON_BOOTS_PATH, ICON_ATTACK_PATH, ICON_HP_PATH, SKULL_ICON_PATH,
+    REDLINE_RIGHT_TEXTURE_PATH, REDLINE_LEFT_TEXTURE_PATH,
+    background_path, portrait_path, hp_gradient_table, FADE_CACHE,
+)
+from text_layout import FontFitter
+from instrumentation import timed
+
+
+FONTS_DIR = os.path.join(RESSOURCES_DIR, "FONTS")
+TITLE_FONT_PATH = os.path.join(FONTS_DIR, "DragonHunter-9Ynxj.ttf")
+TEXT_FONT_PATH = os.path.join(FONTS_DIR, "Maitree-SemiBold.ttf")
+
+# Les tailles de police Tk sont en points : conversion en pixels (96 dpi)
+POINTS_TO_PIXELS = 96 / 72
+
+# Planches imprimables : 3 x 3 cartes par page
+SHEET_COLUMNS, SHEET_ROWS = 3, 3
+SHEET_MARGIN = 20
+
+
+@lru_cache(maxsize=None)
+def load_font(path, size_pt):
+    return ImageFont.truetype(path, max(1, round(size_pt * POINTS_TO_PIXELS)))
+
+
+def _pil_measure(text, family_path, size):
+    return load_font(family_path, size).getlength(text)
+
+
+TITLE_FITTER = FontFitter(_pil_measure)
+
+
+def display_name(enemy):
+    return enemy["nom"].replace(" ELITE", "")
+
+
+# ================== COUCHES DE LA CARTE ==================
+def draw_background(card, enemy, fade_step=0, steps=FADE_STEPS):
+    if fade_step:
+        bg = FADE_CACHE.frames(background_path(enemy), BG_SIZE, steps)[fade_step]
+    else:
+        bg = ASSET_CACHE.get_image(background_path(enemy), BG_SIZE)
+    card.alpha_composite(bg, ((CARD_WIDTH - bg.width) // 2, (CARD_HEIGHT - bg.height) // 2))
+
+
+def draw_title(card, enemy, with_id=True):
+    """Titre centré avec contour noir, puis l'identifiant (optionnel) en dessous."""
+    draw = ImageDraw.Draw(card)
+    width, height = CARD_WIDTH, CARD_HEIGHT
+    title = display_name(enemy)
+    title_color = "#FFD700" if enemy["elite"] else "white"
+
+    font_size = TITLE_FITTER.fit(title, TITLE_FONT_PATH, width * 0.85,
+                                 int(width * 0.06), int(width * 0.04))
+    font = load_font(TITLE_FONT_PATH, font_size)
+    x_center, y_position = width * 0.5, height * 0.08
+
+    # Contour noir
+    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+        draw.text((x_center + dx, y_position + dy), title, font=font, fill="black", anchor="mm")
+    draw.text((x_center, y_position), title, font=font, fill=title_color, anchor="mm")
+
+    if with_id and enemy.get("id") is not None:
+        draw_id(card, enemy["id"])
+
+
+def draw_id(card, enemy_id):
+    draw = ImageDraw.Draw(card)
+    draw.text((CARD_WIDTH * 0.5, CARD_HEIGHT * 0.11), f"#{enemy_id}",
+              font=load_font(TEXT_FONT_PATH, int(CARD_WIDTH * 0.035)),
+              fill="black", anchor="mt")
+
+
+def draw_stats(card, enemy):
+    width, height = CARD_WIDTH, CARD_HEIGHT
+    boots = ASSET_CACHE.get_image(ICON_BOOTS_PATH, STAT_ICON_SIZE, "RGBA")
+    attack = ASSET_CACHE.get_image(ICON_ATTACK_PATH, STAT_ICON_SIZE)
+    card.alpha_composite(boots, (int(width * 0.3), int(height * 0.19)))
+    card.alpha_composite(attack, (int(width * 0.55), int(height * 0.19)))
+
+    draw = ImageDraw.Draw(card)
+    font = load_font(TEXT_FONT_PATH, int(width * 0.06))
+    draw.text((width * 0.428, height * 0.18), f"{enemy['mouvement']}", font=font, fill="black")
+    draw.text((width * 0.658, height * 0.18), f"{enemy['attaque']}", font=font, fill="black")
+
+
+def draw_enemy(card, enemy, fade_step=0, steps=FADE_STEPS):
+    if fade_step:
+        portrait = FADE_CACHE.frames(portrait_path(enemy), ENEMY_SIZE, steps)[fade_step]
+    else:
+        portrait = ASSET_CACHE.get_image(portrait_path(enemy), ENEMY_SIZE)
+    card.alpha_composite(portrait, (int(CARD_WIDTH * 0.5 - portrait.width / 2),
+                                    int(CARD_HEIGHT * 0.57 - portrait.height / 2)))
+
+
+def draw_hp_bar(card, enemy):
+    width, height = CARD_WIDTH, CARD_HEIGHT
+    bar_x, bar_y = width * 0.15, height * 0.87
+    bar_width, bar_height = width * 0.7, height * 0.05
+    pv, pv_max = enemy["pv"], enemy["pv_max"]
+
+    draw = ImageDraw.Draw(card)
+    table = hp_gradient_table(max(pv_max, 0))
+    bar_color = table[min(max(pv, 0), len(table) - 1)]
+    if pv > 0 and bar_color is not None:
+        draw.rectangle((bar_x, bar_y, bar_x + bar_width * pv / pv_max, bar_y + bar_height),
+                       fill=bar_color)
+    draw.rectangle((bar_x, bar_y, bar_x + bar_width, bar_y + bar_height), outline="black", width=2)
+
+    icon = ASSET_CACHE.get_image(ICON_HP_PATH if pv > 0 else SKULL_ICON_PATH, HP_ICON_SIZE, "RGBA")
+    card.alpha_composite(icon, (int(bar_x + 40 - icon.width / 2),
+                                int(bar_y + bar_height / 2 - icon.height / 2)))
+    text = f"{pv} / {pv_max}" if pv > 0 else "Mort"
+    draw.text((bar_x + bar_width / 2, bar_y + bar_height / 2), text,
+              font=load_font(TEXT_FONT_PATH, 12), fill="black", anchor="mm")
+
+
+def draw_death(card):
+    """Croix rouge (deux brosses agrandies x1.5, centrées)."""
+    for path in (REDLINE_RIGHT_TEXTURE_PATH, REDLINE_LEFT_TEXTURE_PATH):
+        src = ASSET_CACHE.get_image(path)
+        brush = ASSET_CACHE.get_image(path, (int(src.width * 1.5), int(src.height * 1.5)))
+        card.alpha_composite(brush, (int(CARD_WIDTH * 0.5 - brush.width / 2),
+                                     int(CARD_HEIGHT * 0.5 - brush.height / 2)))
+
+
+@timed("pil.compose_static_layer")
+def compose_static_layer(enemy, fade_step=0, steps=FADE_STEPS):
+    """
+    Couche fixe d'une carte (fond noir comme le canvas) : fond, titre sans
+    identifiant, stats et portrait. `fade_step` > 0 grise le fond et le portrait.
+    """
+    card = Image.new("RGBA", (CARD_WIDTH, CARD_HEIGHT), "black")
+    draw_background(card, enemy, fade_step, steps)
+    draw_title(card, enemy, with_id=False)
+    draw_stats(card, enemy)
+    draw_enemy(card, enemy, fade_step, steps)
+    return card
+
+
+def render_card(enemy, with_hp_bar=True):
+    """Rend une carte complète en image RGBA."""
+    dead = with_hp_bar and enemy["pv"] == 0
+    card = compose_static_layer(enemy, FADE_STEPS if dead else 0)
+    if enemy.get("id") is not None:
+        draw_id(card, enemy["id"])
+    if with_hp_bar:
+        draw_hp_bar(card, enemy)
+    if dead:
+        draw_death(card)
+    return card
+
+
+# ================== EXPORT EN LOT ==================
+def card_filename(enemy):
+    slug = re.sub(r"[^a-z0-9]+", "_", enemy["nom"].lower()).strip("_")
+    return f"{enemy['id']:03d}_{slug}.png"
+
+
+def _render_to_file(enemy, out_dir):
+    """Tâche d'un processus du pool : rend une carte et l'écrit en PNG."""
+    path = os.path.join(out_dir, card_filename(enemy))
+    render_card(enemy).save(path, optimize=False)
+    return path
+
+
+def render_batch(enemies, out_dir, workers=None):
+    """Rend toutes les cartes sur un pool de processus ; retourne les chemins PNG."""
+    os.makedirs(out_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(enemies) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_render_to_file, enemies, [out_dir] * len(enemies),
+                             chunksize=chunksize))
+
+
+def build_contact_sheets(card_paths, out_dir, prefix="planche"):
+    """Assemble les cartes en planches imprimables de SHEET_COLUMNS x SHEET_ROWS."""
+    per_sheet = SHEET_COLUMNS * SHEET_ROWS
+    sheet_size = (SHEET_COLUMNS * (CARD_WIDTH + SHEET_MARGIN) + SHEET_MARGIN,
+                  SHEET_ROWS * (CARD_HEIGHT + SHEET_MARGIN) + SHEET_MARGIN)
+    sheets = []
+    for page, start in enumerate(range(0, len(card_paths), per_sheet), start=1):
+        sheet = Image.new("RGB", sheet_size, "white")
+        for i, path in enumerate(card_paths[start:start + per_sheet]):
+            row, col = divmod(i, SHEET_COLUMNS)
+            with Image.open(path) as card:
+                sheet.paste(card.convert("RGB"),
+                            (SHEET_MARGIN + col * (CARD_WIDTH + SHEET_MARGIN),
+                             SHEET_MARGIN + row * (CARD_HEIGHT + SHEET_MARGIN)))
+        sheet_path = os.path.join(out_dir, f"{prefix}_{page:02d}.png")
+        sheet.save(sheet_path, dpi=(150, 150))
+        sheets.append(sheet_path)
+    return sheets
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export des cartes ennemies en PNG (sans affichage).")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--catalogue", action="store_true", help="tout le catalogue `ennemis`")
+    source.add_argument("--scenario", nargs="+", metavar="NOM",
+                        help="monstres d'un scénario (versions normale et élite)")
+    parser.add_argument("--out", default="export", help="dossier de sortie")
+    parser.add_argument("--workers", type=int, default=None, help="nombre de processus")
+    parser.add_argument("--planches", action="store_true", help="génère aussi des planches imprimables")
+    args = parser.parse_args(argv)
+
+    from catalogue import CATALOGUE
+    CATALOGUE.load()
+    if args.catalogue:
+        enemies = [CATALOGUE.by_name[nom] for nom in CATALOGUE.names()]
+    else:
+        enemies = []
+        for nom in args.scenario:
+            base = nom.replace(" ELITE", "")
+            for variant in (base, f"{base} ELITE"):
+                enemy = CATALOGUE.get(variant)
+                if enemy is None:
+                    print(f"❌ Aucun ennemi trouvé pour ID/Nom : {variant}")
+                else:
+                    enemies.append(enemy)
+
+    start = time.perf_counter()
+    paths = render_batch(enemies, args.out, args.workers)
+    print(f"✅ {len(paths)} cartes rendues en {time.perf_counter() - start:.2f} s dans {args.out}")
+    if args.planches:
+        sheets = build_contact_sheets(paths, args.out)
+        print(f"✅ {len(sheets)} planche(s) générée(s)")
+
+
+if __name__ == "__main__":
+    main()
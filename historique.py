@@ -0,0 +1,204 @@
+"""
+Historique annuler / rétablir des actions de combat.
+
+Chaque modification du combat (PV, mort, apparition, retrait des morts) est
+une commande réversible qui ne touche que ses propres ennemis : appliquer ou
+annuler coûte O(taille de la commande), jamais O(taille du combat).
+
+Chaque application ou annulation est aussi ajoutée au journal de session
+(`session.journal_actions`), écrit par lots avec les lignes du combat. Le
+journal suffit à rejouer une session depuis un combat vide.
+"""
+import json
+from collections import deque
+from combat_state import COMBAT_STORE
+
+
+# Nombre d'actions gardées dans la pile d'annulation
+UNDO_MAX = 200
+
+
+# ================== COMMANDES ==================
+class Commande:
+    """Action réversible. `app` fournit le champ de bataille et les animations."""
+    kind = None
+
+    def apply(self, app):
+        raise NotImplementedError
+
+    def revert(self, app):
+        raise NotImplementedError
+
+    def payload(self):
+        raise NotImplementedError
+
+    @classmethod
+    def from_payload(cls, data):
+        raise NotImplementedError
+
+
+class ChangementPV(Commande):
+    """Changement de PV d'un ou plusieurs ennemis : {id: (ancien, nouveau)}."""
+    kind = "pv"
+
+    def __init__(self, changes):
+        self.changes = changes
+        if any(new == 0 for _, new in changes.values()):
+            self.kind = "mort"
+
+    def apply(self, app):
+        app.appliquer_pv({i: new for i, (_, new) in self.changes.items()})
+
+    def revert(self, app):
+        app.appliquer_pv({i: old for i, (old, _) in self.changes.items()})
+
+    def payload(self):
+        return {"changes": [[i, old, new] for i, (old, new) in self.changes.items()]}
+
+    @classmethod
+    def from_payload(cls, data):
+        return cls({i: (old, new) for i, old, new in data["changes"]})
+
+
+class Apparition(Commande):
+    """Ennemis ajoutés en fin de grille (lignes complètes, IDs compris)."""
+    kind = "apparition"
+
+    def __init__(self, rows):
+        self.rows = [dict(row) for row in rows]
+
+    def apply(self, app):
+        app.inserer_lignes(self.rows)
+
+    def revert(self, app):
+        app.retirer_lignes([row["id"] for row in self.rows])
+
+    def payload(self):
+        return {"rows": self.rows}
+
+    @classmethod
+    def from_payload(cls, data):
+        return cls(data["rows"])
+
+
+class Retrait(Commande):
+    """Ennemis retirés de la grille ; l'annulation les remet à leur place."""
+    kind = "retrait"
+
+    def __init__(self, rows, positions):
+        self.rows = [dict(row) for row in rows]
+        self.positions = list(positions)
+
+    def apply(self, app):
+        app.retirer_lignes([row["id"] for row in self.rows])
+
+    def revert(self, app):
+        app.inserer_lignes(self.rows, self.positions)
+
+    def payload(self):
+        return {"rows": self.rows, "positions": self.positions}
+
+    @classmethod
+    def from_payload(cls, data):
+        return cls(data["rows"], data["positions"])
+
+
+COMMANDES = {cls.kind: cls for cls in (ChangementPV, Apparition, Retrait)}
+COMMANDES["mort"] = ChangementPV
+
+
+# ================== PILE ANNULER / RÉTABLIR ==================
+class HistoriqueCombat:
+    def __init__(self, app, max_len=UNDO_MAX):
+        self.app = app
+        self.undo_stack = deque(maxlen=max_len)
+        self.redo_stack = deque(maxlen=max_len)
+        # Entrées ajoutées au journal pendant cette session (combat modifié ?)
+        self.entrees = 0
+
+    def _log(self, action, cmd):
+        self._log_raw(action, cmd.kind, cmd.payload())
+
+    def _log_raw(self, action, kind, data):
+        COMBAT_STORE.log_action(action, kind, json.dumps(data, separators=(",", ":")))
+        self.entrees += 1
+
+    def execute(self, cmd):
+        """Applique une commande et l'empile."""
+        cmd.apply(self.app)
+        self.record(cmd)
+
+    def record(self, cmd):
+        """Empile une commande déjà appliquée (ex : clic sur une carte)."""
+        self.undo_stack.append(cmd)
+        self.redo_stack.clear()
+        self._log("apply", cmd)
+
+    def undo(self):
+        if not self.undo_stack:
+            return None
+        cmd = self.undo_stack.pop()
+        cmd.revert(self.app)
+        self.redo_stack.append(cmd)
+        self._log("revert", cmd)
+        return cmd
+
+    def redo(self):
+        if not self.redo_stack:
+            return None
+        cmd = self.redo_stack.pop()
+        cmd.apply(self.app)
+        self.undo_stack.append(cmd)
+        self._log("redo", cmd)
+        return cmd
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+
+    def reset(self, rows):
+        """
+        Combat remplacé en entier (restauration d'un instantané) : piles
+        vidées, lignes notées au journal pour que le rejeu reparte d'ici.
+        """
+        self.clear()
+        self._log_raw("apply", "restauration", {"rows": rows})
+
+    # ================== REJEU ==================
+    def rejouer(self, journal):
+        """
+        Rejoue un journal [(action, type, données JSON)] sur un combat vide,
+        sans animation (aucune carte n'est encore affichée). `action` vaut
+        "apply", "revert" (annuler) ou "redo" (rétablir). Les piles et le
+        journal de la nouvelle session sont reconstruits au passage : le
+        rejeu peut lui-même être annulé ou rejoué. Retourne le nombre
+        d'entrées rejouées.
+        """
+        count = 0
+        for action, kind, donnees in journal:
+            data = json.loads(donnees)
+            if kind == "restauration":
+                self.app.remplacer_lignes(data["rows"])
+                self.reset(data["rows"])
+                count += 1
+                continue
+            cls = COMMANDES.get(kind)
+            if cls is None:
+                print(f"⚠️ Action inconnue dans le journal : {kind}")
+                continue
+            cmd = cls.from_payload(data)
+            # Mêmes opérations sur les piles que pendant la session d'origine
+            if action == "apply":
+                self.execute(cmd)
+            elif action == "revert" and self.undo_stack:
+                self.undo()
+            elif action == "redo" and self.redo_stack:
+                self.redo()
+            elif action == "revert":
+                cmd.revert(self.app)
+                self._log("revert", cmd)
+            else:
+                cmd.apply(self.app)
+                self._log("redo", cmd)
+            count += 1
+        return count
@@ -0,0 +1,161 @@
+"""
+Instrumentation optionnelle des chemins critiques.
+
+Activée par la variable d'environnement GLOOMHAVEN_PROFILE=1 ou l'option
+--profile. Le décorateur `timed` enregistre, par opération, le nombre
+d'appels et un histogramme des durées ; les statistiques sont écrites dans
+PROFILE_STATS_PATH à la sortie.
+
+Désactivée, `timed` retourne la fonction d'origine telle quelle : aucun
+surcoût à l'exécution.
+
+STARTUP mesure les phases du démarrage ; l'option --startup-profile en
+affiche le détail une fois l'application prête.
+"""
+import atexit
+import bisect
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+
+ENABLED = os.environ.get("GLOOMHAVEN_PROFILE") == "1" or "--profile" in sys.argv
+STARTUP_PROFILE = "--startup-profile" in sys.argv
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILE_STATS_PATH = os.path.join(BASE_DIR, "profile_stats.json")
+
+# Bornes supérieures des classes de l'histogramme (ms) ; la dernière est ouverte
+HISTOGRAM_BOUNDS_MS = (0.1, 0.5, 1, 2, 5, 10, 20, 50, 100, 250)
+
+
+class OperationStats:
+    """Compteurs d'une opération : appels, durées cumulée/max, histogramme."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+
+    def add(self, ms):
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self.buckets[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, ms)] += 1
+
+    def as_dict(self):
+        labels = [f"<={b}" for b in HISTOGRAM_BOUNDS_MS] + [f">{HISTOGRAM_BOUNDS_MS[-1]}"]
+        return {
+            "count": self.count,
+            "total_ms": self.total_ms,
+            "avg_ms": self.total_ms / self.count if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "histogram_ms": dict(zip(labels, self.buckets)),
+        }
+
+
+class Profiler:
+    """Agrège les mesures de toutes les opérations instrumentées (thread-safe)."""
+
+    def __init__(self):
+        self._ops = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, ms):
+        with self._lock:
+            stats = self._ops.get(name)
+            if stats is None:
+                stats = self._ops[name] = OperationStats()
+            stats.add(ms)
+
+    def stats(self):
+        with self._lock:
+            return {name: op.as_dict() for name, op in sorted(self._ops.items())}
+
+    def report(self, limit=None):
+        """Lignes texte triées par temps cumulé décroissant (pour l'overlay)."""
+        rows = sorted(self.stats().items(), key=lambda item: -item[1]["total_ms"])
+        return [f"{name:<28} {s['count']:>7}  moy {s['avg_ms']:7.2f} ms  max {s['max_ms']:7.2f} ms"
+                for name, s in rows[:limit]]
+
+    def reset(self):
+        with self._lock:
+            self._ops.clear()
+
+    def dump(self, path=PROFILE_STATS_PATH):
+        """Écrit les statistiques en JSON."""
+        stats = self.stats()
+        if not stats:
+            return
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"histogram_bounds_ms": HISTOGRAM_BOUNDS_MS, "operations": stats},
+                          f, indent=2, ensure_ascii=False)
+            print(f"✅ Statistiques de profilage écrites dans {path}")
+        except OSError as e:
+            print(f"⚠️ Statistiques de profilage non écrites ({path}) : {e}")
+
+
+PROFILER = Profiler()
+
+
+def timed(name):
+    """
+    Décorateur de mesure. Sans instrumentation, la fonction est retournée
+    inchangée (aucune enveloppe).
+    """
+    def decorator(func):
+        if not ENABLED:
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                PROFILER.record(name, (time.perf_counter() - start) * 1000)
+        return wrapper
+    return decorator
+
+
+# ================== DÉMARRAGE ==================
+class PhaseTimer:
+    """Durée de chaque phase du démarrage, depuis l'import de ce module."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases = []  # (nom, durée ms)
+        self._last = self.start
+
+    def mark(self, name):
+        """Clôt une phase qui a commencé à la fin de la précédente."""
+        now = time.perf_counter()
+        self.phases.append((name, (now - self._last) * 1000))
+        self._last = now
+
+    @contextmanager
+    def phase(self, name):
+        self._last = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.mark(name)
+
+    def report(self):
+        total = (self._last - self.start) * 1000
+        lines = [f"⏱️ Démarrage : {total:.1f} ms au total"]
+        lines += [f"   {name:<24} {ms:8.1f} ms" for name, ms in self.phases]
+        return lines
+
+
+STARTUP = PhaseTimer()
+
+
+if ENABLED:
+    atexit.register(PROFILER.dump)
@@ -0,0 +1,143 @@
+"""
+Migrations versionnées du schéma SQLite.
+
+La version courante est stockée dans `PRAGMA user_version`. Au démarrage,
+toutes les migrations manquantes sont appliquées dans une seule
+transaction : soit la base est entièrement à jour, soit rien ne change.
+"""
+import sqlite3
+
+
+def _columns(conn, table):
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def _add_column(conn, table, definition):
+    """ALTER TABLE ADD COLUMN, seulement si la colonne n'existe pas déjà."""
+    name = definition.split()[0]
+    if name not in _columns(conn, table):
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {definition}")
+
+
+# ================== MIGRATIONS ==================
+def _v1_schema_de_base(conn):
+    """Tables du schéma réellement livré avec `ennemy_mod.db`."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS ennemis (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nom TEXT NOT NULL,
+            numero INTEGER,
+            mouvement INTEGER NOT NULL,
+            attaque INTEGER NOT NULL,
+            pv INTEGER NOT NULL,
+            pv_max INTEGER NOT NULL,
+            elite INTEGER DEFAULT 0,  -- 0 = normal, 1 = élite
+            boss INTEGER DEFAULT 0,   -- 0 = normal, 1 = boss
+            image TEXT
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS ennemis_combat (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nom TEXT,
+            numero INTEGER,
+            mouvement INTEGER,
+            attaque INTEGER,
+            pv INTEGER,
+            pv_max INTEGER,
+            elite INTEGER,
+            image TEXT
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS ressources_ui (
+            id INTEGER PRIMARY KEY,
+            nom TEXT,
+            texture TEXT,
+            icon TEXT,
+            image TEXT
+        )
+    """)
+
+
+def _v2_colonnes_manquantes(conn):
+    """
+    Rattrape les bases créées par l'ancien `connect_db` : colonnes `numero`
+    et `boss` absentes de `ennemis`, et `ennemis_combat` indexée par
+    `ennemi_id` au lieu de `id` (table de combat jetable : recréée).
+    """
+    _add_column(conn, "ennemis", "numero INTEGER")
+    _add_column(conn, "ennemis", "boss INTEGER DEFAULT 0")
+
+    if "id" not in _columns(conn, "ennemis_combat"):
+        conn.execute("DROP TABLE ennemis_combat")
+        _v1_schema_de_base(conn)
+
+    _add_column(conn, "ennemis_combat", "ennemi_source_id INTEGER REFERENCES ennemis(id)")
+
+
+def _v3_index(conn):
+    """
+    Index des requêtes fréquentes (recherche par nom). L'index sur `nom` n'est
+    unique que si le catalogue n'a pas de doublons : sinon la migration
+    échouerait et l'application ne démarrerait plus.
+    """
+    doublons = [row[0] for row in conn.execute(
+        "SELECT nom FROM ennemis GROUP BY nom HAVING COUNT(*) > 1 ORDER BY nom")]
+    if doublons:
+        print(f"⚠️ Noms en double dans le catalogue ({', '.join(doublons)}) : "
+              f"index non unique sur `ennemis.nom`.")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_ennemis_nom ON ennemis(nom)")
+    else:
+        conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_ennemis_nom ON ennemis(nom)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_ressources_ui_nom ON ressources_ui(nom)")
+    # Pas d'index sur `ennemis_combat` : la table disparaît en v4
+
+
+def _v4_combat_en_session(conn):
+    """
+    Le combat vit désormais dans la base de session attachée : la table
+    `ennemis_combat` du catalogue (toujours vidée à la sortie) disparaît.
+    """
+    conn.execute("DROP TABLE IF EXISTS main.ennemis_combat")
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_sequence'").fetchone():
+        conn.execute("DELETE FROM main.sqlite_sequence WHERE name = 'ennemis_combat'")
+
+
+MIGRATIONS = (
+    (1, _v1_schema_de_base),
+    (2, _v2_colonnes_manquantes),
+    (3, _v3_index),
+    (4, _v4_combat_en_session),
+)
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn):
+    """
+    Applique les migrations manquantes en une transaction.
+    Retourne la version du schéma après migration.
+    """
+    version = schema_version(conn)
+    pending = [(v, step) for v, step in MIGRATIONS if v > version]
+    if not pending:
+        return version
+
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        for v, step in pending:
+            step(conn)
+        conn.execute(f"PRAGMA user_version = {pending[-1][0]}")
+        conn.commit()
+    except sqlite3.Error as e:
+        conn.rollback()
+        print(f"❌ Échec de la migration du schéma (version {version}) : {e}")
+        raise
+
+    print(f"✅ Schéma migré de la version {version} à {pending[-1][0]}")
+    return pending[-1][0]
@@ -0,0 +1,51 @@
+"""
+Instantané compact de la session de combat.
+
+Le fichier contient les lignes du combat dans l'ordre de la grille (PV,
+élite, état mort compris) et permet de reconstruire tout le champ de
+bataille en une seule passe après un redémarrage.
+"""
+import json
+import os
+from combat_state import COMBAT_COLUMNS
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_PATH = os.path.join(BASE_DIR, "combat_snapshot.json")
+SNAPSHOT_VERSION = 1
+
+
+def save_snapshot(store, order, path=SNAPSHOT_PATH):
+    """Écrit les lignes du combat (dans l'ordre `order`) dans un fichier JSON compact."""
+    rows = [[store.get(enemy_id)[col] for col in COMBAT_COLUMNS]
+            for enemy_id in order if store.get(enemy_id) is not None]
+    data = {"version": SNAPSHOT_VERSION, "columns": COMBAT_COLUMNS, "rows": rows}
+
+    # Écriture atomique : un crash pendant la sauvegarde garde l'ancien fichier
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+    print(f"✅ Combat sauvegardé ({len(rows)} ennemis).")
+    return len(rows)
+
+
+def load_snapshot(path=SNAPSHOT_PATH):
+    """Retourne les lignes (dicts) de l'instantané, dans l'ordre de la grille."""
+    if not os.path.exists(path):
+        print("❌ Aucun combat sauvegardé.")
+        return []
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ Instantané illisible : {e}")
+        return []
+
+    if data.get("version") != SNAPSHOT_VERSION:
+        print(f"❌ Version d'instantané non supportée : {data.get('version')}")
+        return []
+
+    columns = data["columns"]
+    return [dict(zip(columns, row)) for row in data["rows"]]
@@ -0,0 +1,38 @@
+"""
+Tests de non-régression du magasin de combat (écriture différée).
+
+    python -m pytest -q test_combat_state.py
+"""
+import os
+import pytest
+import db_manager
+from combat_state import CombatStore
+
+
+def combat_row(pv=5):
+    return {"ennemi_source_id": 1, "nom": "Pillard Vermling", "mouvement": 2, "attaque": 1,
+            "pv": pv, "pv_max": 5, "elite": 0, "image": "pillard_vermling.png"}
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Magasin vide sur un catalogue et une session jetables."""
+    db_manager.close_all()
+    monkeypatch.setattr(db_manager, "DB_PATH", os.fspath(tmp_path / "catalogue.db"))
+    monkeypatch.setattr(db_manager, "SESSION_DB_PATH", os.fspath(tmp_path / "session.db"))
+    db_manager.reset_session()
+    yield CombatStore()
+    db_manager.close_all()
+
+
+def test_restore_after_unflushed_edit(store):
+    a, b = store.add_many([combat_row(), combat_row()])
+    store.flush()
+    store.set_pv(b, 3)  # Modification non écrite
+
+    store.restore([dict(store.get(a), pv=1)])
+    store.flush()
+
+    conn = db_manager.get_connection()
+    assert conn.execute("SELECT id, pv FROM ennemis_combat").fetchall() == [(a, 1)]
+    assert store.get(b) is None
@@ -0,0 +1,52 @@
+"""
+Ajustement de la taille de police des titres de cartes.
+
+La largeur du texte est mesurée avec les métriques de police (aucun élément
+de canvas jetable), la taille est trouvée par recherche dichotomique et le
+résultat est mémorisé par (texte, police, largeur max).
+"""
+import threading
+
+
+class FontFitter:
+    """Trouve la plus grande taille de police qui tient dans une largeur donnée."""
+
+    def __init__(self, measure):
+        # measure(texte, famille, taille) -> largeur en pixels
+        self.measure = measure
+        self.hits = 0
+        self.misses = 0
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def fit(self, text, family, max_width, max_size, min_size):
+        """
+        Retourne la plus grande taille entre min_size et max_size pour laquelle
+        le texte ne dépasse pas max_width (min_size si aucune ne convient).
+        """
+        key = (text, family, int(max_width), max_size, min_size)
+        with self._lock:
+            size = self._cache.get(key)
+            if size is not None:
+                self.hits += 1
+                return size
+            self.misses += 1
+
+        low, high = min_size, max_size
+        size = min_size
+        while low <= high:
+            mid = (low + high) // 2
+            if self.measure(text, family, mid) <= max_width:
+                size = mid
+                low = mid + 1
+            else:
+                high = mid - 1
+
+        with self._lock:
+            self._cache[key] = size
+        return size
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+